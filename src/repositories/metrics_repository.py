@@ -1,10 +1,61 @@
 """SQLite repository for metrics and logs storage"""
 
 import sqlite3
-from typing import List, Dict, Optional, Any
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Any, Iterable, Tuple
 from datetime import datetime
 
 
+# Applied once to the repository's connection; journal_mode=WAL is persistent and set at schema init
+_CONNECTION_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA busy_timeout=5000;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-65536;
+PRAGMA mmap_size=268435456;
+"""
+
+# Statement text is reused verbatim so sqlite3's per-connection statement cache hits
+_SQL_INSERT_DEVICE_METRIC = """
+INSERT INTO device_metrics (device_id, utilization, status)
+VALUES (?, ?, ?)
+"""
+
+_SQL_INSERT_LINK_METRIC = """
+INSERT INTO link_metrics (link_id, utilization, latency)
+VALUES (?, ?, ?)
+"""
+
+_SQL_INSERT_SERVICE_LOG = """
+INSERT INTO service_logs (service_id, event_type, details)
+VALUES (?, ?, ?)
+"""
+
+_SQL_SELECT_DEVICE_METRICS = """
+SELECT timestamp, utilization, status
+FROM device_metrics
+WHERE device_id = ?
+ORDER BY timestamp DESC
+LIMIT ?
+"""
+
+# Base queries; optional filters and ORDER BY/LIMIT are appended per call
+_SQL_SELECT_LINK_METRICS = """
+SELECT timestamp, utilization, latency
+FROM link_metrics
+WHERE link_id = ?
+"""
+
+_SQL_SELECT_SERVICE_LOGS = """
+SELECT timestamp, event_type, details
+FROM service_logs
+WHERE service_id = ?
+"""
+
+_METRIC_TABLES = ("device_metrics", "link_metrics", "service_logs")
+
+
 class MetricsRepository:
     """Repository for metrics and logs in SQLite"""
     
@@ -13,16 +64,29 @@ class MetricsRepository:
         Initialize MetricsRepository with SQLite connection
         
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, ":memory:", or a "file:" URI
+                (e.g. "file:metrics?mode=memory&cache=shared")
         """
         self.db_path = db_path
+        self._in_memory = db_path == ":memory:" or "mode=memory" in db_path
+        # One long-lived connection shared by all operations, serialized by the lock;
+        # re-entrant so writes inside batched() can take it again
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, uri=db_path.startswith("file:"))
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_CONNECTION_PRAGMAS)
         self._initialize_schema()
     
     def _initialize_schema(self):
         """Create tables for metrics storage"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
         
+        # WAL lets readers and the writer proceed concurrently; not applicable to in-memory DBs
+        if not self._in_memory:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        
         # Create device_metrics table
         cursor.execute("""
         CREATE TABLE IF NOT EXISTS device_metrics (
@@ -56,8 +120,56 @@ class MetricsRepository:
         )
         """)
         
+        # Composite indexes so each get_* query is an index range scan in timestamp order
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_device_metrics_device_ts
+        ON device_metrics (device_id, timestamp DESC)
+        """)
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_link_metrics_link_ts
+        ON link_metrics (link_id, timestamp DESC)
+        """)
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_service_logs_service_event_ts
+        ON service_logs (service_id, event_type, timestamp DESC)
+        """)
+        
         conn.commit()
-        conn.close()
+    
+    def _connection(self) -> sqlite3.Connection:
+        """The open connection; raises RuntimeError once close() has been called"""
+        if self._conn is None:
+            raise RuntimeError("MetricsRepository is closed")
+        return self._conn
+    
+    @contextmanager
+    def batched(self):
+        """
+        Group every write made inside the block into one transaction
+        
+        Commits once on exit, or rolls everything back if the block raises. Other threads'
+        writes wait until the block finishes, so keep slow work (e.g. graph queries) outside it.
+        """
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                if self._batch_depth == 1:
+                    with self._connection():
+                        yield self
+                else:
+                    yield self
+            finally:
+                self._batch_depth -= 1
+    
+    def _write_many(self, sql: str, rows: Iterable[tuple]):
+        """Run an INSERT for each row, committing unless an enclosing batched() block will"""
+        with self._lock:
+            conn = self._connection()
+            if self._batch_depth:
+                conn.executemany(sql, rows)
+            else:
+                with conn:
+                    conn.executemany(sql, rows)
     
     def record_device_metric(self, device_id: str, utilization: float, status: str):
         """
@@ -68,14 +180,16 @@ class MetricsRepository:
             utilization: Current utilization percentage (0.0 to 1.0)
             status: Device status (e.g., 'active', 'inactive', 'maintenance')
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-        INSERT INTO device_metrics (device_id, utilization, status)
-        VALUES (?, ?, ?)
-        """, (device_id, utilization, status))
-        conn.commit()
-        conn.close()
+        self.record_many_device_metrics([(device_id, utilization, status)])
+    
+    def record_many_device_metrics(self, rows: Iterable[Tuple[str, float, str]]):
+        """
+        Record several device metrics in a single transaction
+        
+        Args:
+            rows: (device_id, utilization, status) tuples
+        """
+        self._write_many(_SQL_INSERT_DEVICE_METRIC, rows)
     
     def record_link_metric(self, link_id: str, utilization: float, latency: float):
         """
@@ -86,14 +200,16 @@ class MetricsRepository:
             utilization: Current link utilization percentage (0.0 to 1.0)
             latency: Current latency in milliseconds
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-        INSERT INTO link_metrics (link_id, utilization, latency)
-        VALUES (?, ?, ?)
-        """, (link_id, utilization, latency))
-        conn.commit()
-        conn.close()
+        self.record_many_link_metrics([(link_id, utilization, latency)])
+    
+    def record_many_link_metrics(self, rows: Iterable[Tuple[str, float, float]]):
+        """
+        Record several link metrics in a single transaction
+        
+        Args:
+            rows: (link_id, utilization, latency) tuples
+        """
+        self._write_many(_SQL_INSERT_LINK_METRIC, rows)
     
     def record_service_log(self, service_id: str, event_type: str, details: str):
         """
@@ -104,14 +220,16 @@ class MetricsRepository:
             event_type: Type of event (e.g., 'provisioned', 'decommissioned', 'failed')
             details: Additional details about the event
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-        INSERT INTO service_logs (service_id, event_type, details)
-        VALUES (?, ?, ?)
-        """, (service_id, event_type, details))
-        conn.commit()
-        conn.close()
+        self.record_many_service_logs([(service_id, event_type, details)])
+    
+    def record_many_service_logs(self, rows: Iterable[Tuple[str, str, str]]):
+        """
+        Record several service event logs in a single transaction
+        
+        Args:
+            rows: (service_id, event_type, details) tuples
+        """
+        self._write_many(_SQL_INSERT_SERVICE_LOG, rows)
     
     def get_device_metrics(self, device_id: str, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -124,26 +242,10 @@ class MetricsRepository:
         Returns:
             List of dictionaries containing timestamp, utilization, and status
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-        SELECT timestamp, utilization, status
-        FROM device_metrics
-        WHERE device_id = ?
-        ORDER BY timestamp DESC
-        LIMIT ?
-        """, (device_id, limit))
-        
-        results = []
-        for row in cursor.fetchall():
-            results.append({
-                "timestamp": row[0],
-                "utilization": row[1],
-                "status": row[2]
-            })
-        
-        conn.close()
-        return results
+        with self._lock:
+            rows = self._connection().execute(_SQL_SELECT_DEVICE_METRICS, (device_id, limit)).fetchall()
+        
+        return [dict(row) for row in rows]
     
     def get_link_metrics(self, link_id: str, start_time: Optional[str] = None, 
                         end_time: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
@@ -159,14 +261,7 @@ class MetricsRepository:
         Returns:
             List of dictionaries containing timestamp, utilization, and latency
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        query = """
-        SELECT timestamp, utilization, latency
-        FROM link_metrics
-        WHERE link_id = ?
-        """
+        query = _SQL_SELECT_LINK_METRICS
         params = [link_id]
         
         if start_time:
@@ -180,18 +275,10 @@ class MetricsRepository:
         query += " ORDER BY timestamp DESC LIMIT ?"
         params.append(limit)
         
-        cursor.execute(query, params)
-        
-        results = []
-        for row in cursor.fetchall():
-            results.append({
-                "timestamp": row[0],
-                "utilization": row[1],
-                "latency": row[2]
-            })
+        with self._lock:
+            rows = self._connection().execute(query, params).fetchall()
         
-        conn.close()
-        return results
+        return [dict(row) for row in rows]
     
     def get_service_logs(self, service_id: str, event_type: Optional[str] = None, 
                         limit: int = 100) -> List[Dict[str, Any]]:
@@ -206,14 +293,7 @@ class MetricsRepository:
         Returns:
             List of dictionaries containing timestamp, event_type, and details
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        query = """
-        SELECT timestamp, event_type, details
-        FROM service_logs
-        WHERE service_id = ?
-        """
+        query = _SQL_SELECT_SERVICE_LOGS
         params = [service_id]
         
         if event_type:
@@ -223,21 +303,21 @@ class MetricsRepository:
         query += " ORDER BY timestamp DESC LIMIT ?"
         params.append(limit)
         
-        cursor.execute(query, params)
-        
-        results = []
-        for row in cursor.fetchall():
-            results.append({
-                "timestamp": row[0],
-                "event_type": row[1],
-                "details": row[2]
-            })
+        with self._lock:
+            rows = self._connection().execute(query, params).fetchall()
         
-        conn.close()
-        return results
+        return [dict(row) for row in rows]
+    
+    def clear(self):
+        """Delete every metric and log row in one transaction, keeping the schema"""
+        with self.batched():
+            conn = self._connection()
+            for table in _METRIC_TABLES:
+                conn.execute(f"DELETE FROM {table}")
     
     def close(self):
         """Close database connection (for cleanup)"""
-        # SQLite connections are closed after each operation
-        # This method is provided for API consistency
-        pass
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -7,8 +7,9 @@ data in Neo4j graph database, including devices, links, and services.
 
 import time
 import logging
-from typing import Optional, List, Dict, Any
-from neo4j import GraphDatabase, Driver, Session
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Set
+from neo4j import GraphDatabase, Driver, Session, ManagedTransaction, Record
 from neo4j.exceptions import ServiceUnavailable, SessionExpired
 
 from src.models.device import Device, DeviceType, DeviceStatus
@@ -18,11 +19,130 @@ from src.models.service import Service
 logger = logging.getLogger(__name__)
 
 
+# Parameterized Cypher sent verbatim on every call so the server-side plan cache hits
+_CYPHER_CREATE_DEVICE = """
+CREATE (d:Device {
+    id: $id,
+    name: $name,
+    type: $type,
+    capacity: $capacity,
+    location: $location,
+    status: $status,
+    utilization: $utilization
+})
+RETURN d
+"""
+
+_CYPHER_CREATE_DEVICES_BULK = """
+UNWIND $rows AS row
+CREATE (d:Device {
+    id: row.id,
+    name: row.name,
+    type: row.type,
+    capacity: row.capacity,
+    location: row.location,
+    status: row.status,
+    utilization: row.utilization
+})
+RETURN count(d) as created_count
+"""
+
+_CYPHER_GET_DEVICE = """
+MATCH (d:Device {id: $device_id})
+RETURN d
+"""
+
+_CYPHER_DELETE_DEVICE = """
+MATCH (d:Device {id: $device_id})
+DETACH DELETE d
+RETURN count(d) as deleted_count
+"""
+
+_CYPHER_CREATE_LINK = """
+MATCH (source:Device {id: $source_id})
+MATCH (target:Device {id: $target_id})
+CREATE (source)-[l:LINK {
+    id: $id,
+    bandwidth: $bandwidth,
+    type: $type,
+    latency: $latency,
+    utilization: $utilization,
+    status: $status
+}]->(target)
+RETURN l
+"""
+
+_CYPHER_CREATE_LINKS_BULK = """
+UNWIND $rows AS row
+MATCH (source:Device {id: row.source})
+MATCH (target:Device {id: row.target})
+CREATE (source)-[l:LINK {
+    id: row.id,
+    bandwidth: row.bandwidth,
+    type: row.type,
+    latency: row.latency,
+    utilization: row.utilization,
+    status: row.status
+}]->(target)
+RETURN count(l) as created_count
+"""
+
+_CYPHER_GET_LINKS_FOR_DEVICE = """
+MATCH (d:Device {id: $device_id})
+MATCH (d)-[l:LINK]-(other:Device)
+RETURN l, startNode(l).id as source, endNode(l).id as target
+"""
+
+_CYPHER_DELETE_LINK = """
+MATCH ()-[l:LINK {id: $link_id}]-()
+DELETE l
+RETURN count(l) as deleted_count
+"""
+
+_CYPHER_SHORTEST_PATH = """
+MATCH (source:Device {id: $source_id}),
+      (target:Device {id: $target_id}),
+      path = shortestPath((source)-[:LINK*]-(target))
+RETURN [node in nodes(path) | node.id] as device_path
+"""
+
+# Utilization is filtered during expansion and latency after aggregation, all server-side
+_CYPHER_OPTIMAL_PATH = """
+MATCH (source:Device {id: $source_id}),
+      (target:Device {id: $target_id}),
+      path = (source)-[:LINK*]-(target)
+WHERE ALL(rel in relationships(path) WHERE rel.utilization <= $max_utilization)
+WITH path,
+     [node in nodes(path) | node.id] as device_path,
+     reduce(total = 0, rel in relationships(path) | total + rel.latency) as total_latency,
+     reduce(max_util = 0, rel in relationships(path) |
+            CASE WHEN rel.utilization > max_util THEN rel.utilization ELSE max_util END) as max_link_utilization
+WHERE $max_latency IS NULL OR total_latency <= $max_latency
+RETURN device_path, total_latency, max_link_utilization
+ORDER BY length(path), total_latency, max_link_utilization
+LIMIT 1
+"""
+
+
+def _fetch_all(tx: ManagedTransaction, query: str, params: Dict[str, Any]) -> List[Record]:
+    """
+    Transaction function for execute_read/execute_write
+    
+    Records are consumed inside the transaction so they stay valid after it
+    commits, and the driver can safely retry the whole function.
+    """
+    return list(tx.run(query, params))
+
+
 class Neo4jRepository:
     """Repository for topology data in Neo4j"""
     
+    # URIs whose indexes this process has already created; later repositories skip the bootstrap
+    _initialized_uris: Set[str] = set()
+    
     def __init__(self, uri: str, user: str, password: str, 
-                 max_retry_attempts: int = 3, retry_delay: float = 1.0):
+                 max_retry_attempts: int = 3, retry_delay: float = 1.0,
+                 cache_enabled: bool = False, cache_size: int = 100):
         """
         Initialize Neo4j repository with connection management
         
@@ -32,6 +152,11 @@ class Neo4jRepository:
             password: Neo4j password
             max_retry_attempts: Maximum number of connection retry attempts
             retry_delay: Initial delay between retries in seconds (exponential backoff)
+            cache_enabled: Serve repeated get_device/get_links_for_device calls from an
+                in-memory LRU cache, invalidated by writes through this repository. Writes
+                made outside it (e.g. ServiceOrchestrator's direct driver.session() queries)
+                skip invalidation and can leave stale entries
+            cache_size: Maximum number of cached lookups when caching is enabled
         """
         self.uri = uri
         self.user = user
@@ -39,9 +164,12 @@ class Neo4jRepository:
         self.max_retry_attempts = max_retry_attempts
         self.retry_delay = retry_delay
         self.driver: Optional[Driver] = None
+        self._cache_enabled = cache_enabled
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[tuple, Any]" = OrderedDict()
         
         self._connect_with_retry()
-        self._initialize_indexes()
+        self.ensure_indexes()
     
     def _connect_with_retry(self) -> None:
         """
@@ -78,6 +206,30 @@ class Neo4jRepository:
         
         raise ServiceUnavailable(f"Could not connect to Neo4j: {last_exception}")
     
+    def ensure_indexes(self, force: bool = False) -> None:
+        """
+        Create the indexes unless this process already did so for this URI
+        
+        Args:
+            force: Recreate them anyway, e.g. after reconnecting to a database that was
+                wiped or replaced at the same URI
+        """
+        if force or self.uri not in Neo4jRepository._initialized_uris:
+            self._initialize_indexes()
+    
+    @classmethod
+    def forget_indexes(cls, uri: Optional[str] = None) -> None:
+        """
+        Drop the record of which URIs have indexes, so the next repository creates them again
+        
+        Args:
+            uri: URI to forget; all URIs when omitted
+        """
+        if uri is None:
+            cls._initialized_uris.clear()
+        else:
+            cls._initialized_uris.discard(uri)
+    
     def _initialize_indexes(self) -> None:
         """
         Create indexes for query optimization
@@ -111,6 +263,7 @@ class Neo4jRepository:
                 """)
                 
                 logger.info("Neo4j indexes created successfully")
+                Neo4jRepository._initialized_uris.add(self.uri)
                 
         except Exception as e:
             logger.error(f"Error creating indexes: {e}")
@@ -127,6 +280,34 @@ class Neo4jRepository:
             logger.info("Closing Neo4j connection")
             self.driver.close()
             self.driver = None
+        self._cache.clear()
+    
+    # Read Cache
+    
+    def _cache_get(self, key: tuple) -> Optional[Any]:
+        """Return a cached lookup result, marking it most recently used"""
+        if not self._cache_enabled or key not in self._cache:
+            return None
+        self._cache.move_to_end(key)
+        return self._cache[key]
+    
+    def _cache_put(self, key: tuple, value: Any) -> None:
+        """Store a lookup result, evicting the least recently used entry when full"""
+        if not self._cache_enabled:
+            return
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+    
+    def _invalidate_device(self, device_id: str) -> None:
+        """Drop the cached device lookup for device_id"""
+        self._cache.pop(("device", device_id), None)
+    
+    def _invalidate_links(self) -> None:
+        """Drop all cached link lookups (a link write can affect both endpoints)"""
+        for key in [key for key in self._cache if key[0] == "links"]:
+            del self._cache[key]
 
     # Device CRUD Operations
     
@@ -144,25 +325,14 @@ class Neo4jRepository:
             logger.error("Neo4j driver not initialized")
             return False
         
+        self._invalidate_device(device.id)
+        
         try:
             with self.driver.session() as session:
-                query = """
-                CREATE (d:Device {
-                    id: $id,
-                    name: $name,
-                    type: $type,
-                    capacity: $capacity,
-                    location: $location,
-                    status: $status,
-                    utilization: $utilization
-                })
-                RETURN d
-                """
-                
                 device_dict = device.to_dict()
-                result = session.run(query, **device_dict)
+                records = session.execute_write(_fetch_all, _CYPHER_CREATE_DEVICE, device_dict)
                 
-                created = result.single() is not None
+                created = bool(records)
                 if created:
                     logger.info(f"Created device: {device.id}")
                 return created
@@ -171,6 +341,36 @@ class Neo4jRepository:
             logger.error(f"Error creating device {device.id}: {e}")
             return False
     
+    def create_devices_bulk(self, devices: List[Device]) -> int:
+        """
+        Create several device nodes in a single round-trip using UNWIND
+        
+        Args:
+            devices: Device objects to create
+            
+        Returns:
+            int: Number of devices created (0 on error)
+        """
+        if not self.driver:
+            logger.error("Neo4j driver not initialized")
+            return 0
+        
+        for device in devices:
+            self._invalidate_device(device.id)
+        
+        try:
+            with self.driver.session() as session:
+                rows = [device.to_dict() for device in devices]
+                records = session.execute_write(_fetch_all, _CYPHER_CREATE_DEVICES_BULK, {"rows": rows})
+                
+                created = records[0]["created_count"] if records else 0
+                logger.info(f"Created {created} devices in bulk")
+                return created
+                
+        except Exception as e:
+            logger.error(f"Error creating {len(devices)} devices in bulk: {e}")
+            return 0
+    
     def get_device(self, device_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a device by ID
@@ -185,19 +385,18 @@ class Neo4jRepository:
             logger.error("Neo4j driver not initialized")
             return None
         
+        cached = self._cache_get(("device", device_id))
+        if cached is not None:
+            return dict(cached)
+        
         try:
             with self.driver.session() as session:
-                query = """
-                MATCH (d:Device {id: $device_id})
-                RETURN d
-                """
+                records = session.execute_read(_fetch_all, _CYPHER_GET_DEVICE, {"device_id": device_id})
                 
-                result = session.run(query, device_id=device_id)
-                record = result.single()
-                
-                if record:
-                    device_node = record["d"]
-                    return dict(device_node)
+                if records:
+                    device_props = dict(records[0]["d"])
+                    self._cache_put(("device", device_id), device_props)
+                    return dict(device_props)
                 
                 return None
                 
@@ -220,6 +419,8 @@ class Neo4jRepository:
             logger.error("Neo4j driver not initialized")
             return False
         
+        self._invalidate_device(device_id)
+        
         try:
             with self.driver.session() as session:
                 # Build SET clause dynamically
@@ -233,9 +434,9 @@ class Neo4jRepository:
                 """
                 
                 params = {"device_id": device_id, **properties}
-                result = session.run(query, **params)
+                records = session.execute_write(_fetch_all, query, params)
                 
-                updated = result.single() is not None
+                updated = bool(records)
                 if updated:
                     logger.info(f"Updated device: {device_id}")
                 return updated
@@ -258,18 +459,15 @@ class Neo4jRepository:
             logger.error("Neo4j driver not initialized")
             return False
         
+        # DETACH DELETE also removes the device's links
+        self._invalidate_device(device_id)
+        self._invalidate_links()
+        
         try:
             with self.driver.session() as session:
-                query = """
-                MATCH (d:Device {id: $device_id})
-                DETACH DELETE d
-                RETURN count(d) as deleted_count
-                """
+                records = session.execute_write(_fetch_all, _CYPHER_DELETE_DEVICE, {"device_id": device_id})
                 
-                result = session.run(query, device_id=device_id)
-                record = result.single()
-                
-                deleted = record and record["deleted_count"] > 0
+                deleted = bool(records) and records[0]["deleted_count"] > 0
                 if deleted:
                     logger.info(f"Deleted device: {device_id}")
                 return deleted
@@ -294,22 +492,10 @@ class Neo4jRepository:
             logger.error("Neo4j driver not initialized")
             return False
         
+        self._invalidate_links()
+        
         try:
             with self.driver.session() as session:
-                query = """
-                MATCH (source:Device {id: $source_id})
-                MATCH (target:Device {id: $target_id})
-                CREATE (source)-[l:LINK {
-                    id: $id,
-                    bandwidth: $bandwidth,
-                    type: $type,
-                    latency: $latency,
-                    utilization: $utilization,
-                    status: $status
-                }]->(target)
-                RETURN l
-                """
-                
                 link_dict = link.to_dict()
                 params = {
                     "source_id": link.source_device_id,
@@ -322,8 +508,8 @@ class Neo4jRepository:
                     "status": link_dict["status"]
                 }
                 
-                result = session.run(query, **params)
-                created = result.single() is not None
+                records = session.execute_write(_fetch_all, _CYPHER_CREATE_LINK, params)
+                created = bool(records)
                 
                 if created:
                     logger.info(f"Created link: {link.id} from {link.source_device_id} to {link.target_device_id}")
@@ -333,6 +519,37 @@ class Neo4jRepository:
             logger.error(f"Error creating link {link.id}: {e}")
             return False
     
+    def create_links_bulk(self, links: List[Link]) -> int:
+        """
+        Create several link relationships in a single round-trip using UNWIND
+        
+        Links whose source or target device does not exist are skipped.
+        
+        Args:
+            links: Link objects to create
+            
+        Returns:
+            int: Number of links created (0 on error)
+        """
+        if not self.driver:
+            logger.error("Neo4j driver not initialized")
+            return 0
+        
+        self._invalidate_links()
+        
+        try:
+            with self.driver.session() as session:
+                rows = [link.to_dict() for link in links]
+                records = session.execute_write(_fetch_all, _CYPHER_CREATE_LINKS_BULK, {"rows": rows})
+                
+                created = records[0]["created_count"] if records else 0
+                logger.info(f"Created {created} links in bulk")
+                return created
+                
+        except Exception as e:
+            logger.error(f"Error creating {len(links)} links in bulk: {e}")
+            return 0
+    
     def get_links_for_device(self, device_id: str) -> List[Dict[str, Any]]:
         """
         Query all links connected to a device
@@ -347,23 +564,22 @@ class Neo4jRepository:
             logger.error("Neo4j driver not initialized")
             return []
         
+        cached = self._cache_get(("links", device_id))
+        if cached is not None:
+            return [dict(link) for link in cached]
+        
         try:
             with self.driver.session() as session:
-                query = """
-                MATCH (d:Device {id: $device_id})
-                MATCH (d)-[l:LINK]-(other:Device)
-                RETURN l, startNode(l).id as source, endNode(l).id as target
-                """
-                
-                result = session.run(query, device_id=device_id)
+                records = session.execute_read(_fetch_all, _CYPHER_GET_LINKS_FOR_DEVICE, {"device_id": device_id})
                 
                 links = []
-                for record in result:
+                for record in records:
                     link_props = dict(record["l"])
                     link_props["source"] = record["source"]
                     link_props["target"] = record["target"]
                     links.append(link_props)
                 
+                self._cache_put(("links", device_id), [dict(link) for link in links])
                 return links
                 
         except Exception as e:
@@ -385,6 +601,8 @@ class Neo4jRepository:
             logger.error("Neo4j driver not initialized")
             return False
         
+        self._invalidate_links()
+        
         try:
             with self.driver.session() as session:
                 # Build SET clause dynamically
@@ -398,9 +616,9 @@ class Neo4jRepository:
                 """
                 
                 params = {"link_id": link_id, **properties}
-                result = session.run(query, **params)
+                records = session.execute_write(_fetch_all, query, params)
                 
-                updated = result.single() is not None
+                updated = bool(records)
                 if updated:
                     logger.info(f"Updated link: {link_id}")
                 return updated
@@ -423,18 +641,13 @@ class Neo4jRepository:
             logger.error("Neo4j driver not initialized")
             return False
         
+        self._invalidate_links()
+        
         try:
             with self.driver.session() as session:
-                query = """
-                MATCH ()-[l:LINK {id: $link_id}]-()
-                DELETE l
-                RETURN count(l) as deleted_count
-                """
-                
-                result = session.run(query, link_id=link_id)
-                record = result.single()
+                records = session.execute_write(_fetch_all, _CYPHER_DELETE_LINK, {"link_id": link_id})
                 
-                deleted = record and record["deleted_count"] > 0
+                deleted = bool(records) and records[0]["deleted_count"] > 0
                 if deleted:
                     logger.info(f"Deleted link: {link_id}")
                 return deleted
@@ -460,7 +673,7 @@ class Neo4jRepository:
             with self.driver.session() as session:
                 # Get all devices
                 devices_query = "MATCH (d:Device) RETURN d"
-                devices_result = session.run(devices_query)
+                devices_result = session.execute_read(_fetch_all, devices_query, {})
                 devices = [dict(record["d"]) for record in devices_result]
                 
                 # Get all links
@@ -468,7 +681,7 @@ class Neo4jRepository:
                 MATCH (source:Device)-[l:LINK]->(target:Device)
                 RETURN source.id as source, target.id as target, properties(l) as link
                 """
-                links_result = session.run(links_query)
+                links_result = session.execute_read(_fetch_all, links_query, {})
                 
                 links = []
                 for record in links_result:
@@ -501,18 +714,12 @@ class Neo4jRepository:
         
         try:
             with self.driver.session() as session:
-                query = """
-                MATCH (source:Device {id: $source_id}),
-                      (target:Device {id: $target_id}),
-                      path = shortestPath((source)-[:LINK*]-(target))
-                RETURN [node in nodes(path) | node.id] as device_path
-                """
-                
-                result = session.run(query, source_id=source_id, target_id=target_id)
-                record = result.single()
+                records = session.execute_read(
+                    _fetch_all, _CYPHER_SHORTEST_PATH, {"source_id": source_id, "target_id": target_id}
+                )
                 
-                if record:
-                    path = record["device_path"]
+                if records:
+                    path = records[0]["device_path"]
                     logger.info(f"Found shortest path from {source_id} to {target_id}: {path}")
                     return path
                 
@@ -546,42 +753,18 @@ class Neo4jRepository:
         
         try:
             with self.driver.session() as session:
-                # Find all paths and filter by constraints
-                query = """
-                MATCH (source:Device {id: $source_id}),
-                      (target:Device {id: $target_id}),
-                      path = (source)-[:LINK*]-(target)
-                WHERE ALL(rel in relationships(path) WHERE rel.utilization <= $max_utilization)
-                WITH path, 
-                     [node in nodes(path) | node.id] as device_path,
-                     reduce(total = 0, rel in relationships(path) | total + rel.latency) as total_latency,
-                     reduce(max_util = 0, rel in relationships(path) | 
-                            CASE WHEN rel.utilization > max_util THEN rel.utilization ELSE max_util END) as max_link_utilization
-                """
-                
-                # Add latency constraint if specified
-                if max_latency is not None:
-                    query += " WHERE total_latency <= $max_latency"
-                
-                query += """
-                RETURN device_path, total_latency, max_link_utilization
-                ORDER BY length(path), total_latency, max_link_utilization
-                LIMIT 1
-                """
-                
+                # A null max_latency disables the latency filter inside the query
                 params = {
                     "source_id": source_id,
                     "target_id": target_id,
-                    "max_utilization": max_utilization
+                    "max_utilization": max_utilization,
+                    "max_latency": max_latency
                 }
                 
-                if max_latency is not None:
-                    params["max_latency"] = max_latency
-                
-                result = session.run(query, **params)
-                record = result.single()
+                records = session.execute_read(_fetch_all, _CYPHER_OPTIMAL_PATH, params)
                 
-                if record:
+                if records:
+                    record = records[0]
                     optimal_path = {
                         "path": record["device_path"],
                         "total_latency": record["total_latency"],
@@ -621,10 +804,10 @@ class Neo4jRepository:
                 ORDER BY s.created_at DESC
                 """
                 
-                result = session.run(query)
+                records = session.execute_read(_fetch_all, query, {})
                 services = []
                 
-                for record in result:
+                for record in records:
                     service = {
                         "id": record["id"],
                         "service_type": record["service_type"],
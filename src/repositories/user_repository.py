@@ -1,22 +1,55 @@
 """User repository for managing user data in SQLite"""
 
 import sqlite3
+import threading
 from typing import Optional, List
 from src.models.user import User, UserRole
 from datetime import datetime
 
 
+# (username, password, role, email, full_name) seeded into an empty users table
+_DEFAULT_USERS = (
+    ("admin", "admin123", UserRole.ADMIN, "admin@intellinet.com", "System Administrator"),
+    ("user", "user123", UserRole.USER, "user@intellinet.com", "Regular User"),
+)
+
+_SQL_INSERT_USER = """
+INSERT INTO users (username, hashed_password, role, email, full_name, disabled, created_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Another repository on the same file may seed concurrently; whichever inserts first wins
+_SQL_INSERT_DEFAULT_USER = """
+INSERT OR IGNORE INTO users (username, hashed_password, role, email, full_name, disabled, created_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 class UserRepository:
     """Repository for user data persistence"""
     
-    def __init__(self, db_path: str = "metrics.db"):
+    def __init__(self, db_path: str = "metrics.db", shared: bool = False):
+        """
+        Initialize UserRepository with SQLite connection
+        
+        Args:
+            db_path: Path to SQLite database file, ":memory:", or a "file:" URI
+            shared: With ":memory:", open the process-wide shared-cache in-memory database
+                so other shared connections see the same users
+        """
+        if shared and db_path == ":memory:":
+            db_path = "file::memory:?cache=shared"
         self.db_path = db_path
+        # One long-lived connection shared by all operations, serialized by the lock;
+        # this also keeps ":memory:" databases alive between calls
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, uri=db_path.startswith("file:"))
         self._initialize_schema()
         self._create_default_users()
     
     def _initialize_schema(self):
         """Create users table if it doesn't exist"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -32,74 +65,57 @@ class UserRepository:
         """)
         
         conn.commit()
-        conn.close()
     
     def _create_default_users(self):
         """Create default admin and user accounts if they don't exist"""
-        from src.services.auth_service import AuthService
+        with self._lock:
+            existing = {row[0] for row in self._conn.execute(
+                f"SELECT username FROM users WHERE username IN ({', '.join('?' * len(_DEFAULT_USERS))})",
+                tuple(default[0] for default in _DEFAULT_USERS)
+            )}
         
-        auth_service = AuthService()
+        missing = [default for default in _DEFAULT_USERS if default[0] not in existing]
+        if not missing:
+            return
         
-        # Check if admin exists
-        if not self.get_user("admin"):
-            admin = User(
-                username="admin",
-                hashed_password=auth_service.get_password_hash("admin123"),
-                role=UserRole.ADMIN,
-                email="admin@intellinet.com",
-                full_name="System Administrator"
-            )
-            self.create_user(admin)
+        from src.services.auth_service import AuthService
         
-        # Check if regular user exists
-        if not self.get_user("user"):
-            user = User(
-                username="user",
-                hashed_password=auth_service.get_password_hash("user123"),
-                role=UserRole.USER,
-                email="user@intellinet.com",
-                full_name="Regular User"
-            )
-            self.create_user(user)
+        # Hash up front, then insert every missing account in one transaction
+        auth_service = AuthService()
+        created_at = datetime.utcnow().isoformat()
+        rows = [
+            (username, auth_service.get_password_hash(password), role.value, email, full_name, 0, created_at)
+            for username, password, role, email, full_name in missing
+        ]
+        
+        with self._lock, self._conn:
+            self._conn.executemany(_SQL_INSERT_DEFAULT_USER, rows)
     
     def create_user(self, user: User) -> bool:
         """Create a new user"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-            INSERT INTO users (username, hashed_password, role, email, full_name, disabled, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                user.username,
-                user.hashed_password,
-                user.role.value,
-                user.email,
-                user.full_name,
-                1 if user.disabled else 0,
-                user.created_at.isoformat() if user.created_at else datetime.utcnow().isoformat()
-            ))
-            
-            conn.commit()
-            conn.close()
+            with self._lock, self._conn:
+                self._conn.execute(_SQL_INSERT_USER, (
+                    user.username,
+                    user.hashed_password,
+                    user.role.value,
+                    user.email,
+                    user.full_name,
+                    1 if user.disabled else 0,
+                    user.created_at.isoformat() if user.created_at else datetime.utcnow().isoformat()
+                ))
             return True
         except sqlite3.IntegrityError:
             return False
     
     def get_user(self, username: str) -> Optional[User]:
         """Get a user by username"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-        SELECT username, hashed_password, role, email, full_name, disabled, created_at
-        FROM users
-        WHERE username = ?
-        """, (username,))
-        
-        row = cursor.fetchone()
-        conn.close()
+        with self._lock:
+            row = self._conn.execute("""
+            SELECT username, hashed_password, role, email, full_name, disabled, created_at
+            FROM users
+            WHERE username = ?
+            """, (username,)).fetchone()
         
         if not row:
             return None
@@ -116,16 +132,14 @@ class UserRepository:
     
     def get_all_users(self) -> List[User]:
         """Get all users"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-        SELECT username, hashed_password, role, email, full_name, disabled, created_at
-        FROM users
-        """)
+        with self._lock:
+            rows = self._conn.execute("""
+            SELECT username, hashed_password, role, email, full_name, disabled, created_at
+            FROM users
+            """).fetchall()
         
         users = []
-        for row in cursor.fetchall():
+        for row in rows:
             users.append(User(
                 username=row[0],
                 hashed_password=row[1],
@@ -136,43 +150,30 @@ class UserRepository:
                 created_at=datetime.fromisoformat(row[6]) if row[6] else None
             ))
         
-        conn.close()
         return users
     
     def update_user(self, user: User) -> bool:
         """Update an existing user"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-        UPDATE users
-        SET hashed_password = ?, role = ?, email = ?, full_name = ?, disabled = ?
-        WHERE username = ?
-        """, (
-            user.hashed_password,
-            user.role.value,
-            user.email,
-            user.full_name,
-            1 if user.disabled else 0,
-            user.username
-        ))
-        
-        affected = cursor.rowcount
-        conn.commit()
-        conn.close()
+        with self._lock, self._conn:
+            affected = self._conn.execute("""
+            UPDATE users
+            SET hashed_password = ?, role = ?, email = ?, full_name = ?, disabled = ?
+            WHERE username = ?
+            """, (
+                user.hashed_password,
+                user.role.value,
+                user.email,
+                user.full_name,
+                1 if user.disabled else 0,
+                user.username
+            )).rowcount
         
         return affected > 0
     
     def delete_user(self, username: str) -> bool:
         """Delete a user"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM users WHERE username = ?", (username,))
-        
-        affected = cursor.rowcount
-        conn.commit()
-        conn.close()
+        with self._lock, self._conn:
+            affected = self._conn.execute("DELETE FROM users WHERE username = ?", (username,)).rowcount
         
         return affected > 0
     
@@ -180,3 +181,10 @@ class UserRepository:
         """Get all users as a dictionary (username -> User)"""
         users = self.get_all_users()
         return {user.username: user for user in users}
+    
+    def close(self):
+        """Close database connection (for cleanup)"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
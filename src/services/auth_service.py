@@ -18,10 +18,19 @@ class AuthService:
     ALGORITHM = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES = 30
     
-    def __init__(self, secret_key: Optional[str] = None, token_expire_minutes: int = 30, user_repository=None):
-        """Initialize auth service with optional custom configuration"""
+    def __init__(self, secret_key: Optional[str] = None, token_expire_minutes: int = 30, user_repository=None,
+                 hash_cost: Optional[int] = None):
+        """
+        Initialize auth service with optional custom configuration
+        
+        Args:
+            hash_cost: Optional bcrypt log2 rounds (4-31). Leave unset in production; tests
+                pass the minimum of 4 to keep hashing cheap.
+        """
         if secret_key:
             self.SECRET_KEY = secret_key
+        if hash_cost is not None:
+            self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=hash_cost)
         self.ACCESS_TOKEN_EXPIRE_MINUTES = token_expire_minutes
         self.user_repository = user_repository
     
@@ -14,6 +14,24 @@ if False:  # TYPE_CHECKING equivalent
 logger = logging.getLogger(__name__)
 
 
+# Default rule conditions; each returns True when the service violates the rule
+
+def _exceeds_device_capacity(service: 'Service', device: Optional['Device'],
+                             link: Optional['Link']) -> bool:
+    """BW001: service bandwidth is more than the device has available"""
+    return device is not None and service.bandwidth > device.calculate_available_capacity()
+
+
+def _exceeds_latency_requirement(service: 'Service', device: Optional['Device'],
+                                 link: Optional['Link']) -> bool:
+    """LAT001: link latency is above the service's latency requirement"""
+    return (
+        link is not None and
+        service.latency_requirement is not None and
+        link.latency > service.latency_requirement
+    )
+
+
 @dataclass
 class RuleCondition:
     """Represents a rule condition for service validation"""
@@ -39,10 +57,7 @@ class RuleEngine:
         self.add_rule(RuleCondition(
             rule_id="BW001",
             name="Bandwidth Capacity Check",
-            condition=lambda service, device, link: (
-                device is not None and 
-                service.bandwidth > device.calculate_available_capacity()
-            ),
+            condition=_exceeds_device_capacity,
             action="reject",
             priority=1
         ))
@@ -51,11 +66,7 @@ class RuleEngine:
         self.add_rule(RuleCondition(
             rule_id="LAT001",
             name="Latency Requirement Check",
-            condition=lambda service, device, link: (
-                link is not None and
-                service.latency_requirement is not None and 
-                link.latency > service.latency_requirement
-            ),
+            condition=_exceeds_latency_requirement,
             action="reject",
             priority=2
         ))
@@ -7,7 +7,7 @@ metrics recording, and rule-based validation.
 """
 
 import logging
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 from datetime import datetime
 
 from src.repositories.neo4j_repository import Neo4jRepository
@@ -120,8 +120,8 @@ class ServiceOrchestrator:
             )
             return False, error_msg
         
-        # Step 4: Update device and link utilization metrics
-        self._update_utilization_metrics(service)
+        # Step 4: Read device and link utilization from the graph
+        device_rows, link_rows = self._collect_utilization_metrics(service)
         
         # Step 5: Update service status and log success
         service.status = ServiceStatus.ACTIVE
@@ -130,11 +130,15 @@ class ServiceOrchestrator:
         success_msg = f"Service {service.id} provisioned successfully on path: {' -> '.join(path)}"
         logger.info(success_msg)
         
-        self.metrics_repo.record_service_log(
-            service.id,
-            "provisioned",
-            success_msg
-        )
+        # Metrics and the success log are committed together
+        with self.metrics_repo.batched():
+            self.metrics_repo.record_many_device_metrics(device_rows)
+            self.metrics_repo.record_many_link_metrics(link_rows)
+            self.metrics_repo.record_service_log(
+                service.id,
+                "provisioned",
+                success_msg
+            )
         
         return True, success_msg
     
@@ -202,29 +206,36 @@ class ServiceOrchestrator:
             logger.error(f"Error creating service in Neo4j: {e}", exc_info=True)
             return False
     
-    def _update_utilization_metrics(self, service: Service) -> None:
+    def _collect_utilization_metrics(
+        self,
+        service: Service
+    ) -> Tuple[List[Tuple[str, float, str]], List[Tuple[str, float, float]]]:
         """
-        Update device and link utilization metrics after service provisioning
+        Read device and link utilization for a provisioned service's path
         
         Args:
             service: Provisioned service
+            
+        Returns:
+            Tuple of (device_id, utilization, status) rows and (link_id, utilization, latency) rows
         """
-        # Record metrics for each device in the path
+        device_rows = []
+        link_rows = []
+        
+        # Metrics for each device in the path
         for device_id in service.path:
             device_data = self.neo4j_repo.get_device(device_id)
             if device_data:
                 # Calculate new utilization (simplified - would need actual calculation)
                 current_utilization = device_data.get("utilization", 0.0)
                 
-                self.metrics_repo.record_device_metric(
+                device_rows.append((
                     device_id,
                     current_utilization,
                     device_data.get("status", "active")
-                )
-                
-                logger.debug(f"Recorded metric for device {device_id}")
+                ))
         
-        # Record metrics for links in the path
+        # Metrics for links in the path
         for i in range(len(service.path) - 1):
             source_id = service.path[i]
             target_id = service.path[i + 1]
@@ -233,12 +244,14 @@ class ServiceOrchestrator:
             links = self.neo4j_repo.get_links_for_device(source_id)
             for link in links:
                 if link.get("target") == target_id or link.get("source") == target_id:
-                    self.metrics_repo.record_link_metric(
+                    link_rows.append((
                         link.get("id", f"{source_id}-{target_id}"),
                         link.get("utilization", 0.0),
                         link.get("latency", 0.0)
-                    )
-                    logger.debug(f"Recorded metric for link {link.get('id')}")
+                    ))
+        
+        logger.debug(f"Service {service.id}: collected {len(device_rows)} device and {len(link_rows)} link metrics")
+        return device_rows, link_rows
 
     def decommission_service(self, service_id: str) -> Tuple[bool, str]:
         """
@@ -279,26 +292,28 @@ class ServiceOrchestrator:
         
         logger.info(f"Service {service_id}: Removed from Neo4j")
         
-        # Step 3: Update device utilization metrics
+        # Step 3: Read device utilization for the freed path
+        device_rows = []
         for device_id in path:
             device_data = self.neo4j_repo.get_device(device_id)
             if device_data:
-                self.metrics_repo.record_device_metric(
+                device_rows.append((
                     device_id,
                     device_data.get("utilization", 0.0),
                     device_data.get("status", "active")
-                )
-                logger.debug(f"Updated metrics for device {device_id} after decommissioning")
+                ))
         
-        # Step 4: Log service decommissioning event
+        # Step 4: Record device metrics and the decommissioning event in one transaction
         success_msg = f"Service {service_id} decommissioned successfully"
         logger.info(success_msg)
         
-        self.metrics_repo.record_service_log(
-            service_id,
-            "decommissioned",
-            success_msg
-        )
+        with self.metrics_repo.batched():
+            self.metrics_repo.record_many_device_metrics(device_rows)
+            self.metrics_repo.record_service_log(
+                service_id,
+                "decommissioned",
+                success_msg
+            )
         
         return True, success_msg
     
@@ -0,0 +1,102 @@
+"""Shared pytest fixtures for the whole test suite"""
+
+import pytest
+
+
+# Passwords used across the auth and user repository suites; hashed once per session
+_TEST_PASSWORDS = (
+    "password",
+    "password2",
+    "password123",
+    "admin123",
+    "user123",
+    "disabled123",
+    "test_password_123",
+)
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Deselect benchmarks unless requested, mark tests that do bcrypt work slow, and move
+    slow tests last so `pytest -x` fails fast
+    """
+    for item in items:
+        # pw_hashes is what hashes; other slow tests carry an explicit @pytest.mark.slow
+        if "pw_hashes" in item.fixturenames:
+            item.add_marker(pytest.mark.slow)
+    
+    # Benchmarks run only when asked for with --benchmark-only (the CI benchmark step),
+    # never in plain local runs or the `-m fast` loop
+    if not config.getoption("benchmark_only", default=False):
+        benchmarks = [item for item in items if "benchmark" in item.fixturenames]
+        if benchmarks:
+            items[:] = [item for item in items if "benchmark" not in item.fixturenames]
+            config.hook.pytest_deselected(items=benchmarks)
+    
+    # Stable sort: module and class order is otherwise preserved
+    items.sort(key=lambda item: item.get_closest_marker("slow") is not None)
+
+
+@pytest.fixture(scope="session")
+def auth_service():
+    """One AuthService for the whole session; it keeps no per-test state"""
+    # Imported here: src.services pulls in the orchestrator and the Neo4j driver,
+    # which the model-only suites must not need
+    from src.services.auth_service import AuthService
+    
+    # Minimum bcrypt cost: tests check hashing behaviour, not its strength
+    return AuthService(secret_key="test-secret-key", hash_cost=4)
+
+
+@pytest.fixture(scope="session")
+def pw_hashes(auth_service):
+    """Password -> hash for every test password, so each slow hash runs once per session"""
+    return {password: auth_service.get_password_hash(password) for password in _TEST_PASSWORDS}
+
+
+@pytest.fixture(scope="session")
+def sample_tokens(auth_service):
+    """
+    (username, role) -> access token, signed once per session
+    
+    For tests that only decode or inspect a valid token; tests about per-call
+    token creation should call create_access_token themselves.
+    """
+    from src.models.user import UserRole
+    
+    identities = (("testuser", UserRole.ADMIN), ("admin", UserRole.ADMIN), ("user", UserRole.USER))
+    return {
+        (username, role): auth_service.create_access_token(username=username, role=role)
+        for username, role in identities
+    }
+
+
+@pytest.fixture(scope="session")
+def neo4j_container():
+    """
+    Start one Neo4j container for the whole test session
+    
+    Tests stay isolated through the per-test cleanup in their repository fixtures.
+    testcontainers is imported here so suites that never touch Neo4j don't need it.
+    """
+    from testcontainers.neo4j import Neo4jContainer
+    
+    container = Neo4jContainer("neo4j:5.12")
+    container.with_env("NEO4J_server_memory_pagecache_size", "512M")
+    container.start()
+    yield container
+    container.stop()
+
+
+@pytest.fixture(scope="session")
+def neo4j_connection(neo4j_container):
+    """
+    (uri, user, password) for the session container, resolved once
+    
+    get_connection_url() probes the container, so repository fixtures unpack this instead.
+    """
+    return (
+        neo4j_container.get_connection_url(),
+        neo4j_container.NEO4J_USER,
+        neo4j_container.NEO4J_ADMIN_PASSWORD,
+    )
@@ -0,0 +1,105 @@
+"""Lightweight test doubles shared across suites"""
+
+
+class FakeAuthService:
+    """
+    Stand-in for AuthService's password hashing in tests that only need a stored hash
+    
+    Hashes are a reversible "fake$" prefix, so no bcrypt work is done. Tests that check
+    hashing itself must use the real AuthService.
+    """
+    
+    def get_password_hash(self, password: str) -> str:
+        """Return a deterministic fake hash"""
+        return f"fake${password}"
+    
+    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        """Check a password against a fake hash"""
+        return hashed_password == f"fake${plain_password}"
+
+
+class FakeResult:
+    """Minimal neo4j Result: single() returns the canned record"""
+    
+    def __init__(self, record):
+        self._record = record
+    
+    def single(self):
+        """Return the canned record"""
+        return self._record
+
+
+class FakeSession:
+    """
+    Minimal neo4j Session for code that runs raw Cypher through ``driver.session()``
+    
+    run() returns the next record in ``queued`` and falls back to ``record`` once the queue
+    is empty. Every query is recorded in ``queries`` as ``(query, params)``.
+    """
+    
+    def __init__(self):
+        self.record = None
+        self.queued = []
+        self.queries = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def run(self, query: str, **params):
+        """Record the query and return the next canned result"""
+        self.queries.append((query, params))
+        return FakeResult(self.queued.pop(0) if self.queued else self.record)
+
+
+class FakeDriver:
+    """Driver whose session() always hands out the same FakeSession"""
+    
+    def __init__(self, session: FakeSession):
+        self._session = session
+    
+    def session(self, **kwargs):
+        return self._session
+
+
+class FakeNeo4jRepository:
+    """
+    Stand-in for Neo4jRepository in ServiceOrchestrator tests
+    
+    Lookups return the canned ``path``, ``device`` and ``links`` attributes, and every call
+    is appended to ``calls`` as ``(method_name, args)``. Raw Cypher the orchestrator runs
+    through ``driver.session()`` goes to ``session``, a FakeSession.
+    """
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Drop canned responses and recorded calls, so one instance can serve many tests"""
+        self.path = None
+        self.device = None
+        self.links = []
+        self.calls = []
+        self.session = FakeSession()
+        self.driver = FakeDriver(self.session)
+    
+    def calls_to(self, method_name: str) -> list:
+        """Argument tuples of every recorded call to ``method_name``, in order"""
+        return [args for name, args in self.calls if name == method_name]
+    
+    def find_shortest_path(self, source_id: str, target_id: str):
+        """Return the canned path"""
+        self.calls.append(("find_shortest_path", (source_id, target_id)))
+        return self.path
+    
+    def get_device(self, device_id: str):
+        """Return the canned device record"""
+        self.calls.append(("get_device", (device_id,)))
+        return self.device
+    
+    def get_links_for_device(self, device_id: str):
+        """Return the canned link records"""
+        self.calls.append(("get_links_for_device", (device_id,)))
+        return self.links
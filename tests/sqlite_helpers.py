@@ -0,0 +1,52 @@
+"""
+SQLite inspection helpers shared by the repository and service suites
+
+The one place test code reaches into a repository's private connection.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+
+
+@contextmanager
+def captured_sql(repo):
+    """
+    Record every statement the repository's connection runs inside the block
+    
+    Statements are captured with their parameters bound, so each can be fed to query_plan().
+    """
+    statements = []
+    repo._conn.set_trace_callback(statements.append)
+    try:
+        yield statements
+    finally:
+        repo._conn.set_trace_callback(None)
+
+
+def selects(statements):
+    """The SELECT statements among captured ones"""
+    return [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+
+
+def fetch_all(repo, sql: str) -> list:
+    """Run a read-only inspection query (sqlite_master, PRAGMA) on the repository's connection"""
+    return repo._conn.execute(sql).fetchall()
+
+
+def query_plan(repo, sql: str) -> str:
+    """EXPLAIN QUERY PLAN details for a captured statement, joined into one string"""
+    return " ".join(row[-1] for row in repo._conn.execute(f"EXPLAIN QUERY PLAN {sql}"))
+
+
+def snapshot(repo) -> sqlite3.Connection:
+    """Copy the repository's whole database into a new in-memory connection"""
+    copy = sqlite3.connect(":memory:")
+    with repo._lock:
+        repo._conn.backup(copy)
+    return copy
+
+
+def restore(repo, copy: sqlite3.Connection):
+    """Overwrite the repository's database with a copy taken by snapshot()"""
+    with repo._lock:
+        copy.backup(repo._conn)
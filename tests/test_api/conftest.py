@@ -2,31 +2,22 @@
 
 import pytest
 from fastapi.testclient import TestClient
-import os
-import tempfile
 
-from src.api.app import app, neo4j_repo, metrics_repo, rule_engine, service_orchestrator
 from src.repositories.neo4j_repository import Neo4jRepository
 from src.repositories.metrics_repository import MetricsRepository
+from src.models.user import User, UserRole
 from src.services.rule_engine import RuleEngine
 from src.services.service_orchestrator import ServiceOrchestrator
 
 
 @pytest.fixture(scope="function")
-def test_db():
-    """Create a temporary test database"""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as f:
-        db_path = f.name
-    
-    yield db_path
-    
-    # Cleanup
-    if os.path.exists(db_path):
-        os.unlink(db_path)
+def test_db(tmp_path):
+    """Temporary test database; pytest prunes tmp_path directories in bulk"""
+    return str(tmp_path / "metrics.db")
 
 
 @pytest.fixture(scope="function")
-def mock_neo4j_repo(monkeypatch):
+def mock_neo4j_repo():
     """Mock Neo4j repository for testing"""
     class MockNeo4jRepository:
         def __init__(self):
@@ -57,6 +48,12 @@ def mock_neo4j_repo(monkeypatch):
                 "links": list(self.links.values())
             }
         
+        def get_links_for_device(self, device_id):
+            return [
+                link for link in self.links.values()
+                if device_id in (link["source"], link["target"])
+            ]
+        
         def find_shortest_path(self, source_id, target_id):
             # Simple mock: return path if both devices exist
             if source_id in self.devices and target_id in self.devices:
@@ -92,65 +89,60 @@ def mock_neo4j_repo(monkeypatch):
         def close(self):
             pass
     
-    mock_repo = MockNeo4jRepository()
-    
-    # Patch the global repository
-    import src.api.app as app_module
-    app_module.neo4j_repo = mock_repo
-    
-    return mock_repo
+    return MockNeo4jRepository()
 
 
 
 @pytest.fixture(scope="function")
-def mock_metrics_repo(test_db, monkeypatch):
+def mock_metrics_repo(test_db):
     """Mock metrics repository for testing"""
     metrics_repo = MetricsRepository(db_path=test_db)
     
-    # Patch the global repository
-    import src.api.app as app_module
-    app_module.metrics_repo = metrics_repo
-    
     yield metrics_repo
     
     metrics_repo.close()
 
 
 @pytest.fixture(scope="function")
-def mock_rule_engine(monkeypatch):
+def mock_rule_engine():
     """Mock rule engine for testing"""
-    rule_engine = RuleEngine()
-    
-    # Patch the global rule engine
-    import src.api.app as app_module
-    app_module.rule_engine = rule_engine
-    
-    return rule_engine
+    return RuleEngine()
 
 
 @pytest.fixture(scope="function")
-def mock_service_orchestrator(mock_neo4j_repo, mock_metrics_repo, mock_rule_engine, monkeypatch):
-    """Mock service orchestrator for testing"""
-    orchestrator = ServiceOrchestrator(
+def mock_service_orchestrator(mock_neo4j_repo, mock_metrics_repo, mock_rule_engine):
+    """Service orchestrator that keeps services in the mock repository instead of raw Cypher"""
+    class MockServiceOrchestrator(ServiceOrchestrator):
+        def _create_service_in_neo4j(self, service):
+            return self.neo4j_repo.create_service(service)
+        
+        def _get_service_from_neo4j(self, service_id):
+            return self.neo4j_repo.get_service(service_id)
+        
+        def _delete_service_from_neo4j(self, service_id):
+            return self.neo4j_repo.delete_service(service_id)
+    
+    return MockServiceOrchestrator(
         neo4j_repo=mock_neo4j_repo,
         metrics_repo=mock_metrics_repo,
         rule_engine=mock_rule_engine
     )
-    
-    # Patch the global orchestrator
-    import src.api.app as app_module
-    app_module.service_orchestrator = orchestrator
-    
-    return orchestrator
 
 
-@pytest.fixture(scope="function")
-def client(mock_neo4j_repo, mock_metrics_repo, mock_rule_engine, mock_service_orchestrator):
-    """Create a test client with mocked dependencies"""
-    # Create a new app instance without lifespan for testing
-    from fastapi import FastAPI, Depends
+@pytest.fixture(scope="session")
+def test_app():
+    """Create the test application once per session (without lifespan)"""
+    from fastapi import FastAPI
+    from fastapi.exceptions import RequestValidationError
     from fastapi.middleware.cors import CORSMiddleware
-    from src.api import app as app_module
+    from starlette.exceptions import HTTPException as StarletteHTTPException
+    from src.api.app import health_check, root
+    from src.api.middleware import (
+        global_exception_handler,
+        http_exception_handler,
+        validation_exception_handler,
+        logging_middleware
+    )
     
     test_app = FastAPI(title="Test IntelliNet Orchestrator API")
     
@@ -163,7 +155,36 @@ def client(mock_neo4j_repo, mock_metrics_repo, mock_rule_engine, mock_service_or
         allow_headers=["*"],
     )
     
-    # Override dependency injection functions
+    # Same middleware and error format as the real application
+    test_app.middleware("http")(logging_middleware)
+    test_app.add_exception_handler(Exception, global_exception_handler)
+    test_app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+    test_app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    
+    # Import and include routers
+    from src.api.routes import topology, services, analytics
+    test_app.include_router(topology.router)
+    test_app.include_router(services.router)
+    test_app.include_router(analytics.router)
+    
+    # Health and root endpoints
+    test_app.get("/health")(health_check)
+    test_app.get("/")(root)
+    
+    return test_app
+
+
+@pytest.fixture(scope="session")
+def session_client(test_app):
+    """Single TestClient kept open for the whole session so startup runs once"""
+    with TestClient(test_app, raise_server_exceptions=True) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="function")
+def client(test_app, session_client, mock_neo4j_repo, mock_metrics_repo, mock_rule_engine,
+           mock_service_orchestrator):
+    """Test client with this test's mocked dependencies injected"""
     def override_get_neo4j_repository():
         return mock_neo4j_repo
     
@@ -176,6 +197,9 @@ def client(mock_neo4j_repo, mock_metrics_repo, mock_rule_engine, mock_service_or
     def override_get_service_orchestrator():
         return mock_service_orchestrator
     
+    def override_get_current_active_user():
+        return User(username="admin", hashed_password="", role=UserRole.ADMIN)
+    
     # Import dependency functions
     from src.api.app import (
         get_neo4j_repository,
@@ -183,23 +207,15 @@ def client(mock_neo4j_repo, mock_metrics_repo, mock_rule_engine, mock_service_or
         get_rule_engine,
         get_service_orchestrator
     )
-    
-    # Import and include routers
-    from src.api.routes import topology, services, analytics
-    test_app.include_router(topology.router)
-    test_app.include_router(services.router)
-    test_app.include_router(analytics.router)
+    from src.api.dependencies import get_current_active_user
     
     # Override dependencies
     test_app.dependency_overrides[get_neo4j_repository] = override_get_neo4j_repository
     test_app.dependency_overrides[get_metrics_repository] = override_get_metrics_repository
     test_app.dependency_overrides[get_rule_engine] = override_get_rule_engine
     test_app.dependency_overrides[get_service_orchestrator] = override_get_service_orchestrator
+    test_app.dependency_overrides[get_current_active_user] = override_get_current_active_user
     
-    # Add health endpoint
-    @test_app.get("/health")
-    async def health_check():
-        return {"status": "healthy", "service": "IntelliNet Orchestrator", "version": "1.0.0"}
+    yield session_client
     
-    with TestClient(test_app, raise_server_exceptions=True) as test_client:
-        yield test_client
+    test_app.dependency_overrides.clear()
@@ -23,6 +23,7 @@ def user_repo():
 class TestAuthEndpoints:
     """Test suite for authentication endpoints"""
     
+    @pytest.mark.slow
     async def test_login_success(self):
         """Test successful login"""
         async with AsyncClient(app=app, base_url="http://test") as client:
@@ -42,6 +43,7 @@ class TestAuthEndpoints:
         assert data["username"] == "admin"
         assert data["role"] == "admin"
     
+    @pytest.mark.slow
     async def test_login_wrong_password(self):
         """Test login with wrong password"""
         async with AsyncClient(app=app, base_url="http://test") as client:
@@ -70,6 +72,7 @@ class TestAuthEndpoints:
         
         assert response.status_code == 401
     
+    @pytest.mark.slow
     async def test_get_current_user_with_valid_token(self):
         """Test getting current user with valid token"""
         async with AsyncClient(app=app, base_url="http://test") as client:
@@ -113,6 +116,7 @@ class TestAuthEndpoints:
         
         assert response.status_code == 401
     
+    @pytest.mark.slow
     async def test_oauth2_token_endpoint(self):
         """Test OAuth2 compatible token endpoint"""
         async with AsyncClient(app=app, base_url="http://test") as client:
@@ -153,6 +157,7 @@ class TestRoleBasedAuthorization:
             )
             return response.json()["access_token"]
     
+    @pytest.mark.slow
     async def test_admin_can_create_device(self):
         """Test that admin can create devices"""
         token = await self.get_admin_token()
@@ -172,6 +177,7 @@ class TestRoleBasedAuthorization:
         # Admin should be able to create device (201 or 409 if exists)
         assert response.status_code in [201, 409]
     
+    @pytest.mark.slow
     async def test_user_cannot_create_device(self):
         """Test that regular user cannot create devices"""
         token = await self.get_user_token()
@@ -191,6 +197,7 @@ class TestRoleBasedAuthorization:
         # Regular user should get 403 Forbidden
         assert response.status_code == 403
     
+    @pytest.mark.slow
     async def test_user_can_view_topology(self):
         """Test that regular user can view topology"""
         token = await self.get_user_token()
@@ -204,6 +211,7 @@ class TestRoleBasedAuthorization:
         # Regular user should be able to view topology
         assert response.status_code == 200
     
+    @pytest.mark.slow
     async def test_user_can_provision_service(self):
         """Test that regular user can provision services"""
         token = await self.get_user_token()
@@ -225,6 +233,7 @@ class TestRoleBasedAuthorization:
         # but should not get 403
         assert response.status_code != 403
     
+    @pytest.mark.slow
     async def test_user_cannot_delete_device(self):
         """Test that regular user cannot delete devices"""
         token = await self.get_user_token()
@@ -238,6 +247,7 @@ class TestRoleBasedAuthorization:
         # Regular user should get 403 Forbidden
         assert response.status_code == 403
     
+    @pytest.mark.slow
     async def test_admin_can_delete_device(self):
         """Test that admin can delete devices"""
         token = await self.get_admin_token()
@@ -259,6 +269,7 @@ class TestRoleBasedAuthorization:
         # Should get 401 Unauthorized
         assert response.status_code == 401
     
+    @pytest.mark.slow
     async def test_user_cannot_decommission_service(self):
         """Test that regular user cannot decommission services"""
         token = await self.get_user_token()
@@ -272,6 +283,7 @@ class TestRoleBasedAuthorization:
         # Regular user should get 403 Forbidden
         assert response.status_code == 403
     
+    @pytest.mark.slow
     async def test_admin_can_decommission_service(self):
         """Test that admin can decommission services"""
         token = await self.get_admin_token()
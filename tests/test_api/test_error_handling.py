@@ -90,7 +90,10 @@ def test_response_headers(client):
 
 def test_cors_headers(client):
     """Test that CORS headers are present"""
-    response = client.options("/api/topology/device")
+    response = client.options(
+        "/api/topology/device",
+        headers={"Origin": "http://localhost:3000", "Access-Control-Request-Method": "POST"}
+    )
     
     # CORS headers should be present
     assert "access-control-allow-origin" in response.headers or response.status_code == status.HTTP_200_OK
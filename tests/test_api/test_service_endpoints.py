@@ -58,7 +58,7 @@ def test_provision_service_invalid_type(client):
     assert data["error"]["code"] == "INVALID_SERVICE_TYPE"
 
 
-def test_provision_service_no_path(client):
+def test_provision_service_no_path(client, mock_neo4j_repo):
     """Test service provisioning when no path exists"""
     # Create devices without connecting them
     device1 = {"id": "R1", "name": "Router 1", "type": "MPLS", "capacity": 100.0}
@@ -66,6 +66,9 @@ def test_provision_service_no_path(client):
     client.post("/api/topology/device", json=device1)
     client.post("/api/topology/device", json=device2)
     
+    # Mock no path found
+    mock_neo4j_repo.find_shortest_path = lambda s, t: None
+    
     # Try to provision service
     service_data = {
         "id": "S1",
@@ -1,8 +1,32 @@
 """Integration tests for topology management endpoints"""
 
 import pytest
+from types import MappingProxyType
 from fastapi import status
 
+from src.api.models import DeviceCreate
+from src.api.routes.topology import create_device_from_request
+
+
+# Shared request payloads (read-only; copy or merge before sending)
+_DEV_R1 = MappingProxyType({"id": "R1", "name": "Core Router 1", "type": "MPLS", "capacity": 100.0})
+_DEV_R2 = MappingProxyType({"id": "R2", "name": "Core Router 2", "type": "MPLS", "capacity": 100.0})
+_LINK_L1 = MappingProxyType({
+    "id": "L1",
+    "source_device_id": "R1",
+    "target_device_id": "R2",
+    "bandwidth": 10.0,
+    "type": "fiber",
+    "latency": 5.0
+})
+
+
+def fast_create(repo, **kw):
+    """Seed a known-valid device straight into the repository, skipping HTTP and validation"""
+    device = create_device_from_request(DeviceCreate.model_construct(**kw))
+    assert repo.create_device(device), f"Could not seed device {device.id}"
+    return device
+
 
 def test_health_check(client):
     """Test health check endpoint"""
@@ -24,13 +48,7 @@ def test_root_endpoint(client):
 
 def test_create_device_success(client):
     """Test successful device creation"""
-    device_data = {
-        "id": "R1",
-        "name": "Core Router 1",
-        "type": "MPLS",
-        "capacity": 100.0,
-        "location": "DataCenter-A"
-    }
+    device_data = _DEV_R1 | {"location": "DataCenter-A"}
     
     response = client.post("/api/topology/device", json=device_data)
     assert response.status_code == status.HTTP_201_CREATED
@@ -42,12 +60,7 @@ def test_create_device_success(client):
 
 def test_create_device_invalid_type(client):
     """Test device creation with invalid type"""
-    device_data = {
-        "id": "R1",
-        "name": "Core Router 1",
-        "type": "INVALID_TYPE",
-        "capacity": 100.0
-    }
+    device_data = _DEV_R1 | {"type": "INVALID_TYPE"}
     
     response = client.post("/api/topology/device", json=device_data)
     assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -58,12 +71,7 @@ def test_create_device_invalid_type(client):
 
 def test_create_device_duplicate(client):
     """Test creating duplicate device"""
-    device_data = {
-        "id": "R1",
-        "name": "Core Router 1",
-        "type": "MPLS",
-        "capacity": 100.0
-    }
+    device_data = {**_DEV_R1}
     
     # Create first device
     response = client.post("/api/topology/device", json=device_data)
@@ -78,11 +86,7 @@ def test_create_device_duplicate(client):
 
 def test_create_device_validation_error(client):
     """Test device creation with missing required fields"""
-    device_data = {
-        "id": "R1",
-        "name": "Core Router 1"
-        # Missing type and capacity
-    }
+    device_data = {"id": "R1", "name": "Core Router 1"}  # Missing type and capacity
     
     response = client.post("/api/topology/device", json=device_data)
     assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -90,16 +94,10 @@ def test_create_device_validation_error(client):
     assert data["error"]["code"] == "VALIDATION_ERROR"
 
 
-def test_get_device_success(client):
+def test_get_device_success(client, mock_neo4j_repo):
     """Test getting a device"""
     # Create device first
-    device_data = {
-        "id": "R1",
-        "name": "Core Router 1",
-        "type": "MPLS",
-        "capacity": 100.0
-    }
-    client.post("/api/topology/device", json=device_data)
+    fast_create(mock_neo4j_repo, **_DEV_R1)
     
     # Get device
     response = client.get("/api/topology/device/R1")
@@ -118,16 +116,10 @@ def test_get_device_not_found(client):
 
 
 
-def test_delete_device_success(client):
+def test_delete_device_success(client, mock_neo4j_repo):
     """Test successful device deletion"""
     # Create device first
-    device_data = {
-        "id": "R1",
-        "name": "Core Router 1",
-        "type": "MPLS",
-        "capacity": 100.0
-    }
-    client.post("/api/topology/device", json=device_data)
+    fast_create(mock_neo4j_repo, **_DEV_R1)
     
     # Delete device
     response = client.delete("/api/topology/device/R1")
@@ -145,35 +137,14 @@ def test_delete_device_not_found(client):
     assert data["error"]["code"] == "DEVICE_NOT_FOUND"
 
 
-def test_create_link_success(client):
+def test_create_link_success(client, mock_neo4j_repo):
     """Test successful link creation"""
     # Create devices first
-    device1 = {
-        "id": "R1",
-        "name": "Router 1",
-        "type": "MPLS",
-        "capacity": 100.0
-    }
-    device2 = {
-        "id": "R2",
-        "name": "Router 2",
-        "type": "MPLS",
-        "capacity": 100.0
-    }
-    client.post("/api/topology/device", json=device1)
-    client.post("/api/topology/device", json=device2)
+    fast_create(mock_neo4j_repo, **_DEV_R1)
+    fast_create(mock_neo4j_repo, **_DEV_R2)
     
     # Create link
-    link_data = {
-        "id": "L1",
-        "source_device_id": "R1",
-        "target_device_id": "R2",
-        "bandwidth": 10.0,
-        "type": "fiber",
-        "latency": 5.0
-    }
-    
-    response = client.post("/api/topology/link", json=link_data)
+    response = client.post("/api/topology/link", json={**_LINK_L1})
     assert response.status_code == status.HTTP_201_CREATED
     data = response.json()
     assert data["success"] is True
@@ -182,14 +153,7 @@ def test_create_link_success(client):
 
 def test_create_link_source_not_found(client):
     """Test link creation with non-existent source device"""
-    link_data = {
-        "id": "L1",
-        "source_device_id": "NONEXISTENT",
-        "target_device_id": "R2",
-        "bandwidth": 10.0,
-        "type": "fiber",
-        "latency": 5.0
-    }
+    link_data = _LINK_L1 | {"source_device_id": "NONEXISTENT"}
     
     response = client.post("/api/topology/link", json=link_data)
     assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -197,22 +161,13 @@ def test_create_link_source_not_found(client):
     assert data["error"]["code"] == "DEVICE_NOT_FOUND"
 
 
-def test_create_link_invalid_type(client):
+def test_create_link_invalid_type(client, mock_neo4j_repo):
     """Test link creation with invalid type"""
     # Create devices first
-    device1 = {"id": "R1", "name": "Router 1", "type": "MPLS", "capacity": 100.0}
-    device2 = {"id": "R2", "name": "Router 2", "type": "MPLS", "capacity": 100.0}
-    client.post("/api/topology/device", json=device1)
-    client.post("/api/topology/device", json=device2)
+    fast_create(mock_neo4j_repo, **_DEV_R1)
+    fast_create(mock_neo4j_repo, **_DEV_R2)
     
-    link_data = {
-        "id": "L1",
-        "source_device_id": "R1",
-        "target_device_id": "R2",
-        "bandwidth": 10.0,
-        "type": "INVALID_TYPE",
-        "latency": 5.0
-    }
+    link_data = _LINK_L1 | {"type": "INVALID_TYPE"}
     
     response = client.post("/api/topology/link", json=link_data)
     assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -220,23 +175,12 @@ def test_create_link_invalid_type(client):
     assert data["error"]["code"] == "INVALID_LINK_TYPE"
 
 
-def test_get_topology(client):
+def test_get_topology(client, mock_neo4j_repo):
     """Test getting complete topology"""
     # Create some devices and links
-    device1 = {"id": "R1", "name": "Router 1", "type": "MPLS", "capacity": 100.0}
-    device2 = {"id": "R2", "name": "Router 2", "type": "MPLS", "capacity": 100.0}
-    client.post("/api/topology/device", json=device1)
-    client.post("/api/topology/device", json=device2)
-    
-    link_data = {
-        "id": "L1",
-        "source_device_id": "R1",
-        "target_device_id": "R2",
-        "bandwidth": 10.0,
-        "type": "fiber",
-        "latency": 5.0
-    }
-    client.post("/api/topology/link", json=link_data)
+    fast_create(mock_neo4j_repo, **_DEV_R1)
+    fast_create(mock_neo4j_repo, **_DEV_R2)
+    client.post("/api/topology/link", json={**_LINK_L1})
     
     # Get topology
     response = client.get("/api/topology/")
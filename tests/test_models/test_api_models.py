@@ -0,0 +1,79 @@
+"""
+Unit tests for API request models
+Validation errors are asserted directly on the Pydantic models, without the HTTP stack
+"""
+import pytest
+from pydantic import ValidationError
+from src.api.models import DeviceCreate, LinkCreate
+
+pytestmark = [pytest.mark.models, pytest.mark.fast]
+
+
+class TestDeviceCreateValidation:
+    """Test DeviceCreate request validation"""
+    
+    def test_device_create_valid(self):
+        """Test a complete device payload validates"""
+        device = DeviceCreate.model_validate(
+            {"id": "R1", "name": "Core Router 1", "type": "MPLS", "capacity": 100.0}
+        )
+        
+        assert device.id == "R1"
+        assert device.location is None
+    
+    def test_device_create_missing_fields(self):
+        """Test device payload without type and capacity is rejected"""
+        with pytest.raises(ValidationError) as exc:
+            DeviceCreate.model_validate({"id": "R1", "name": "Core Router 1"})
+        
+        errors = exc.value.errors()
+        assert {e["loc"][0] for e in errors} == {"type", "capacity"}
+        assert all(e["type"] == "missing" for e in errors)
+    
+    def test_device_create_non_positive_capacity(self):
+        """Test device capacity must be greater than zero"""
+        with pytest.raises(ValidationError) as exc:
+            DeviceCreate.model_validate(
+                {"id": "R1", "name": "Core Router 1", "type": "MPLS", "capacity": -100.0}
+            )
+        
+        assert exc.value.errors()[0]["type"] == "greater_than"
+
+
+class TestLinkCreateValidation:
+    """Test LinkCreate request validation"""
+    
+    def test_link_create_default_latency(self):
+        """Test link latency defaults to 0.0"""
+        link = LinkCreate.model_validate({
+            "id": "L1",
+            "source_device_id": "R1",
+            "target_device_id": "R2",
+            "bandwidth": 10.0,
+            "type": "fiber"
+        })
+        
+        assert link.latency == 0.0
+    
+    def test_link_create_missing_fields(self):
+        """Test link payload without endpoints is rejected"""
+        with pytest.raises(ValidationError) as exc:
+            LinkCreate.model_validate({"id": "L1", "bandwidth": 10.0, "type": "fiber"})
+        
+        errors = exc.value.errors()
+        assert {e["loc"][0] for e in errors} == {"source_device_id", "target_device_id"}
+        assert all(e["type"] == "missing" for e in errors)
+    
+    def test_link_create_negative_latency(self):
+        """Test link latency cannot be negative"""
+        with pytest.raises(ValidationError) as exc:
+            LinkCreate.model_validate({
+                "id": "L1",
+                "source_device_id": "R1",
+                "target_device_id": "R2",
+                "bandwidth": 10.0,
+                "type": "fiber",
+                "latency": -1.0
+            })
+        
+        assert exc.value.errors()[0]["type"] == "greater_than_equal"
@@ -3,10 +3,39 @@ Unit tests for device models including inheritance and polymorphism
 Tests Requirements: 2.1, 2.2, 2.3, 2.4, 2.5
 """
 import pytest
+from typing import Protocol, runtime_checkable
 from src.models.device import Device, DeviceType, DeviceStatus
 from src.models.specialized_devices import DWDMDevice, MPLSRouter, GPONDevice
 from src.models.service import Service, ServiceType
 
+pytestmark = [pytest.mark.models, pytest.mark.fast]
+
+
+@runtime_checkable
+class Provisionable(Protocol):
+    """What the orchestrator relies on a device for; checked structurally, not by subclass"""
+    
+    def provision(self, service: Service) -> bool: ...
+    
+    def calculate_available_capacity(self) -> float: ...
+
+
+class _DuckDevice:
+    """Provisions services without subclassing Device"""
+    
+    def provision(self, service: Service) -> bool:
+        return True
+    
+    def calculate_available_capacity(self) -> float:
+        return 0.0
+
+
+class _ProvisionOnly:
+    """Has provision but no capacity calculation"""
+    
+    def provision(self, service: Service) -> bool:
+        return True
+
 
 class TestDeviceInheritanceAndPolymorphism:
     """Test device class inheritance and polymorphic behavior"""
@@ -16,23 +45,10 @@ class TestDeviceInheritanceAndPolymorphism:
         with pytest.raises(TypeError):
             Device("D1", "TestDevice", DeviceType.MPLS, 100.0)
     
-    def test_dwdm_device_inherits_from_device(self):
-        """Test DWDM device inherits from Device base class"""
-        dwdm = DWDMDevice("D1", "DWDM1", 100.0)
-        assert isinstance(dwdm, Device)
-        assert isinstance(dwdm, DWDMDevice)
-    
-    def test_mpls_router_inherits_from_device(self):
-        """Test MPLS router inherits from Device base class"""
-        router = MPLSRouter("R1", "Router1", 100.0)
-        assert isinstance(router, Device)
-        assert isinstance(router, MPLSRouter)
-    
-    def test_gpon_device_inherits_from_device(self):
-        """Test GPON device inherits from Device base class"""
-        gpon = GPONDevice("G1", "GPON1", 10.0, is_olt=True)
-        assert isinstance(gpon, Device)
-        assert isinstance(gpon, GPONDevice)
+    @pytest.mark.parametrize("cls", (DWDMDevice, MPLSRouter, GPONDevice))
+    def test_specialized_device_inherits_from_device(self, cls):
+        """Test each specialized device class inherits from Device base class"""
+        assert issubclass(cls, Device)
     
     def test_polymorphic_provision_method(self):
         """Test that provision method works polymorphically across device types"""
@@ -44,13 +60,17 @@ class TestDeviceInheritanceAndPolymorphism:
         
         service = Service("S1", ServiceType.MPLS_VPN, "R1", "R2", 50.0)
         
-        # All devices should have provision method
+        # All devices should satisfy the Provisionable interface
         for device in devices:
-            assert hasattr(device, 'provision')
-            assert callable(device.provision)
+            assert isinstance(device, Provisionable)
             result = device.provision(service)
             assert isinstance(result, bool)
     
+    def test_provisionable_is_structural(self):
+        """Test that the interface check accepts duck types and rejects incomplete ones"""
+        assert isinstance(_DuckDevice(), Provisionable)
+        assert not isinstance(_ProvisionOnly(), Provisionable)
+    
     def test_polymorphic_calculate_available_capacity(self):
         """Test that calculate_available_capacity works polymorphically"""
         devices = [
@@ -60,8 +80,7 @@ class TestDeviceInheritanceAndPolymorphism:
         ]
         
         for device in devices:
-            assert hasattr(device, 'calculate_available_capacity')
-            assert callable(device.calculate_available_capacity)
+            assert isinstance(device, Provisionable)
             capacity = device.calculate_available_capacity()
             assert isinstance(capacity, float)
             assert capacity >= 0
@@ -76,10 +95,10 @@ class TestDWDMDevice:
         
         assert dwdm.id == "D1"
         assert dwdm.name == "DWDM1"
-        assert dwdm.device_type == DeviceType.DWDM
+        assert dwdm.device_type is DeviceType.DWDM
         assert dwdm.capacity == 100.0
         assert dwdm.location == "Site A"
-        assert dwdm.status == DeviceStatus.ACTIVE
+        assert dwdm.status is DeviceStatus.ACTIVE
         assert dwdm.utilization == 0.0
         assert dwdm.wavelengths == 80
         assert dwdm.active_wavelengths == []
@@ -100,8 +119,8 @@ class TestDWDMDevice:
         assert len(dwdm.active_wavelengths) == 1
         assert dwdm.active_wavelengths[0] == "λ1"
     
-    def test_dwdm_provision_multiple_wavelengths(self):
-        """Test provisioning multiple services allocates multiple wavelengths"""
+    def test_dwdm_provision_sequence_order(self):
+        """Test provisioning multiple services allocates wavelengths in order"""
         dwdm = DWDMDevice("D1", "DWDM1", 100.0, wavelengths=80)
         
         for i in range(5):
@@ -135,31 +154,18 @@ class TestDWDMDevice:
         
         assert available == 100.0
     
-    def test_dwdm_calculate_available_capacity_partial(self):
-        """Test capacity calculation with partial wavelength usage"""
+    @pytest.mark.parametrize("used,expected", ((40, 50.0), (80, 0.0)))
+    def test_dwdm_available_capacity_math(self, used, expected):
+        """Test capacity calculation with partial and full wavelength usage"""
         dwdm = DWDMDevice("D1", "DWDM1", 100.0, wavelengths=80)
         
-        # Use 40 wavelengths (50%)
-        for i in range(40):
-            service = Service(f"S{i}", ServiceType.OTN_CIRCUIT, "D1", "D2", 1.0)
-            dwdm.provision(service)
+        # Set wavelength state directly; allocation order is covered by
+        # test_dwdm_provision_sequence_order
+        dwdm.active_wavelengths[:] = [f"λ{i + 1}" for i in range(used)]
         
         available = dwdm.calculate_available_capacity()
         
-        assert available == 50.0
-    
-    def test_dwdm_calculate_available_capacity_empty(self):
-        """Test capacity calculation when all wavelengths are used"""
-        dwdm = DWDMDevice("D1", "DWDM1", 100.0, wavelengths=80)
-        
-        # Use all wavelengths
-        for i in range(80):
-            service = Service(f"S{i}", ServiceType.OTN_CIRCUIT, "D1", "D2", 1.0)
-            dwdm.provision(service)
-        
-        available = dwdm.calculate_available_capacity()
-        
-        assert available == 0.0
+        assert available == expected
 
 
 class TestMPLSRouter:
@@ -171,10 +177,10 @@ class TestMPLSRouter:
         
         assert router.id == "R1"
         assert router.name == "Router1"
-        assert router.device_type == DeviceType.MPLS
+        assert router.device_type is DeviceType.MPLS
         assert router.capacity == 100.0
         assert router.location == "Site B"
-        assert router.status == DeviceStatus.ACTIVE
+        assert router.status is DeviceStatus.ACTIVE
         assert router.utilization == 0.0
         assert router.label_table == {}
         assert router.vpn_instances == []
@@ -267,10 +273,10 @@ class TestGPONDevice:
         
         assert olt.id == "G1"
         assert olt.name == "OLT1"
-        assert olt.device_type == DeviceType.GPON_OLT
+        assert olt.device_type is DeviceType.GPON_OLT
         assert olt.capacity == 10.0
         assert olt.location == "Site C"
-        assert olt.status == DeviceStatus.ACTIVE
+        assert olt.status is DeviceStatus.ACTIVE
         assert olt.is_olt is True
         assert olt.connected_onts == []
         assert olt.split_ratio == 32
@@ -281,7 +287,7 @@ class TestGPONDevice:
         
         assert ont.id == "G2"
         assert ont.name == "ONT1"
-        assert ont.device_type == DeviceType.GPON_ONT
+        assert ont.device_type is DeviceType.GPON_ONT
         assert ont.capacity == 1.0
         assert ont.is_olt is False
         assert ont.connected_onts is None
@@ -426,3 +432,33 @@ class TestDeviceSerialization:
         result = router.to_dict()
         
         assert result["location"] is None
+
+
+class TestProvisioningBenchmarks:
+    """Benchmarks guarding the provision loops against regressions"""
+    
+    @pytest.mark.benchmark(group="dwdm")
+    def test_dwdm_provision_all_wavelengths(self, benchmark):
+        """Benchmark allocating every wavelength on a DWDM device"""
+        services = [Service(f"S{i}", ServiceType.OTN_CIRCUIT, "D1", "D2", 1.0) for i in range(80)]
+        
+        def provision_all():
+            dwdm = DWDMDevice("D1", "DWDM1", 100.0, wavelengths=80)
+            return [dwdm.provision(service) for service in services]
+        
+        results = benchmark(provision_all)
+        
+        assert all(results)
+    
+    @pytest.mark.benchmark(group="mpls")
+    def test_mpls_provision_to_capacity(self, benchmark):
+        """Benchmark provisioning services until an MPLS router is full"""
+        services = [Service(f"S{i}", ServiceType.MPLS_VPN, "R1", "R2", 1.0) for i in range(100)]
+        
+        def provision_all():
+            router = MPLSRouter("R1", "Router1", 100.0)
+            return [router.provision(service) for service in services]
+        
+        results = benchmark(provision_all)
+        
+        assert all(results)
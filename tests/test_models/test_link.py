@@ -5,6 +5,65 @@ Tests Requirements: 2.1, 2.5
 import pytest
 from src.models.link import Link, LinkType
 
+pytestmark = [pytest.mark.models, pytest.mark.fast]
+
+
+_LINK_TYPE_CASES = (
+    (LinkType.FIBER, "fiber"),
+    (LinkType.ETHERNET, "ethernet"),
+    (LinkType.WIRELESS, "wireless"),
+)
+
+_LINK_TYPE_IDS = tuple(val for _, val in _LINK_TYPE_CASES)
+
+# (bandwidth, utilization, expected available bandwidth)
+_AVAILABLE_BW_CASES = (
+    (10.0, 0.5, 5.0),
+    (100.0, 0.8, 20.0),
+    (10.0, 1.0, 0.0),
+    (10.0, 0.1, 9.0),
+    (100.0, 0.3, 70.0),
+    (1.0, 0.9, 0.1),
+    (50.0, 0.0, 50.0),
+)
+
+_LINK_TYPE_NAMES = frozenset(m.name for m in LinkType)
+
+_LINK_DICT_KEYS = frozenset({"id", "source", "target", "bandwidth", "type", "latency", "utilization", "status"})
+
+# Expected to_dict() output for the complete_link_dict fixture
+_COMPLETE_LINK_DICT = (
+    ("id", "L1"),
+    ("source", "D1"),
+    ("target", "D2"),
+    ("bandwidth", 10.0),
+    ("type", "fiber"),
+    ("latency", 5.0),
+    ("utilization", 0.3),
+    ("status", "active"),
+)
+
+
+@pytest.fixture(scope="module")
+def complete_link_dict():
+    """Serialize a fully populated link once for the per-field assertions"""
+    link = Link(
+        id="L1",
+        source_device_id="D1",
+        target_device_id="D2",
+        bandwidth=10.0,
+        link_type=LinkType.FIBER,
+        latency=5.0
+    )
+    link.utilization = 0.3
+    return link.to_dict()
+
+
+@pytest.fixture(scope="module")
+def default_fiber_link():
+    """Shared read-only 10 Gbps fiber link; tests that mutate it must build their own"""
+    return Link("L1", "D1", "D2", 10.0, LinkType.FIBER)
+
 
 class TestLinkCreation:
     """Test Link object creation and initialization"""
@@ -24,7 +83,7 @@ class TestLinkCreation:
         assert link.source_device_id == "D1"
         assert link.target_device_id == "D2"
         assert link.bandwidth == 10.0
-        assert link.link_type == LinkType.FIBER
+        assert link.link_type is LinkType.FIBER
         assert link.latency == 5.0
         assert link.utilization == 0.0
         assert link.status == "active"
@@ -41,143 +100,65 @@ class TestLinkCreation:
         
         assert link.latency == 0.0
     
-    def test_link_with_fiber_type(self):
-        """Test link creation with FIBER type"""
-        link = Link("L1", "D1", "D2", 100.0, LinkType.FIBER)
-        
-        assert link.link_type == LinkType.FIBER
-        assert link.link_type.value == "fiber"
-    
-    def test_link_with_ethernet_type(self):
-        """Test link creation with ETHERNET type"""
-        link = Link("L1", "D1", "D2", 10.0, LinkType.ETHERNET)
-        
-        assert link.link_type == LinkType.ETHERNET
-        assert link.link_type.value == "ethernet"
-    
-    def test_link_with_wireless_type(self):
-        """Test link creation with WIRELESS type"""
-        link = Link("L1", "D1", "D2", 1.0, LinkType.WIRELESS)
+    @pytest.mark.parametrize("lt,val", _LINK_TYPE_CASES, ids=_LINK_TYPE_IDS)
+    def test_link_with_type(self, lt, val):
+        """Test link creation with each link type"""
+        link = Link("L1", "D1", "D2", 10.0, lt)
         
-        assert link.link_type == LinkType.WIRELESS
-        assert link.link_type.value == "wireless"
+        assert link.link_type is lt
+        assert link.link_type.value == val
 
 
 class TestLinkBandwidthCalculation:
     """Test link available bandwidth calculation"""
     
-    def test_calculate_available_bandwidth_no_utilization(self):
+    def test_calculate_available_bandwidth_no_utilization(self, default_fiber_link):
         """Test bandwidth calculation with zero utilization"""
-        link = Link("L1", "D1", "D2", 10.0, LinkType.FIBER)
-        
-        available = link.calculate_available_bandwidth()
+        available = default_fiber_link.calculate_available_bandwidth()
         
         assert available == 10.0
     
-    def test_calculate_available_bandwidth_partial_utilization(self):
-        """Test bandwidth calculation with partial utilization"""
-        link = Link("L1", "D1", "D2", 10.0, LinkType.FIBER)
-        link.utilization = 0.5  # 50% utilized
-        
-        available = link.calculate_available_bandwidth()
-        
-        assert available == 5.0
-    
-    def test_calculate_available_bandwidth_high_utilization(self):
-        """Test bandwidth calculation with high utilization"""
-        link = Link("L1", "D1", "D2", 100.0, LinkType.FIBER)
-        link.utilization = 0.8  # 80% utilized
+    @pytest.mark.parametrize("bandwidth,utilization,expected", _AVAILABLE_BW_CASES)
+    def test_available_bw(self, bandwidth, utilization, expected):
+        """Test bandwidth calculation across capacities and utilization levels"""
+        link = Link("L1", "D1", "D2", bandwidth, LinkType.FIBER)
+        link.utilization = utilization
         
         available = link.calculate_available_bandwidth()
         
-        assert abs(available - 20.0) < 0.001  # Float comparison with tolerance
-    
-    def test_calculate_available_bandwidth_full_utilization(self):
-        """Test bandwidth calculation with full utilization"""
-        link = Link("L1", "D1", "D2", 10.0, LinkType.FIBER)
-        link.utilization = 1.0  # 100% utilized
-        
-        available = link.calculate_available_bandwidth()
-        
-        assert available == 0.0
-    
-    def test_calculate_available_bandwidth_low_utilization(self):
-        """Test bandwidth calculation with low utilization"""
-        link = Link("L1", "D1", "D2", 10.0, LinkType.FIBER)
-        link.utilization = 0.1  # 10% utilized
-        
-        available = link.calculate_available_bandwidth()
-        
-        assert available == 9.0
-    
-    def test_calculate_available_bandwidth_various_capacities(self):
-        """Test bandwidth calculation with different link capacities"""
-        test_cases = [
-            (10.0, 0.5, 5.0),
-            (100.0, 0.3, 70.0),
-            (1.0, 0.9, 0.1),
-            (50.0, 0.0, 50.0),
-        ]
-        
-        for bandwidth, utilization, expected in test_cases:
-            link = Link("L1", "D1", "D2", bandwidth, LinkType.FIBER)
-            link.utilization = utilization
-            
-            available = link.calculate_available_bandwidth()
-            
-            assert abs(available - expected) < 0.001  # Float comparison with tolerance
+        assert available == pytest.approx(expected, abs=1e-3)
 
 
 class TestLinkSerialization:
     """Test Link to_dict() serialization"""
     
-    def test_link_to_dict_complete(self):
+    def test_link_to_dict_complete_keys(self, complete_link_dict):
+        """Test link serialization emits exactly the expected keys"""
+        assert complete_link_dict.keys() == _LINK_DICT_KEYS
+    
+    @pytest.mark.parametrize("key,value", _COMPLETE_LINK_DICT, ids=[k for k, _ in _COMPLETE_LINK_DICT])
+    def test_link_to_dict_complete(self, complete_link_dict, key, value):
         """Test link serialization with all fields"""
-        link = Link(
-            id="L1",
-            source_device_id="D1",
-            target_device_id="D2",
-            bandwidth=10.0,
-            link_type=LinkType.FIBER,
-            latency=5.0
-        )
-        link.utilization = 0.3
-        link.status = "active"
-        
-        result = link.to_dict()
-        
-        assert result["id"] == "L1"
-        assert result["source"] == "D1"
-        assert result["target"] == "D2"
-        assert result["bandwidth"] == 10.0
-        assert result["type"] == "fiber"
-        assert result["latency"] == 5.0
-        assert result["utilization"] == 0.3
-        assert result["status"] == "active"
+        assert complete_link_dict[key] == value
     
-    def test_link_to_dict_with_default_values(self):
-        """Test link serialization with default values"""
-        link = Link("L1", "D1", "D2", 10.0, LinkType.ETHERNET)
-        
-        result = link.to_dict()
+    def test_link_to_dict_with_default_values(self, default_fiber_link):
+        """Test link serialization keys and default values"""
+        result = default_fiber_link.to_dict()
         
+        assert result.keys() == _LINK_DICT_KEYS
+        assert result["type"] == "fiber"
         assert result["latency"] == 0.0
         assert result["utilization"] == 0.0
         assert result["status"] == "active"
     
-    def test_link_to_dict_different_link_types(self):
+    @pytest.mark.parametrize("lt,val", _LINK_TYPE_CASES, ids=_LINK_TYPE_IDS)
+    def test_link_to_dict_different_link_types(self, lt, val):
         """Test serialization preserves link type correctly"""
-        link_types = [
-            (LinkType.FIBER, "fiber"),
-            (LinkType.ETHERNET, "ethernet"),
-            (LinkType.WIRELESS, "wireless")
-        ]
+        link = Link("L1", "D1", "D2", 10.0, lt)
         
-        for link_type, expected_value in link_types:
-            link = Link("L1", "D1", "D2", 10.0, link_type)
-            result = link.to_dict()
-            
-            assert result["type"] == expected_value
+        result = link.to_dict()
+        
+        assert result["type"] == val
     
     def test_link_to_dict_modified_status(self):
         """Test serialization with modified status"""
@@ -195,15 +176,6 @@ class TestLinkSerialization:
         result = link.to_dict()
         
         assert result["latency"] == 100.5
-    
-    def test_link_to_dict_returns_dict_type(self):
-        """Test that to_dict returns a dictionary"""
-        link = Link("L1", "D1", "D2", 10.0, LinkType.FIBER)
-        
-        result = link.to_dict()
-        
-        assert isinstance(result, dict)
-        assert len(result) == 8  # Should have 8 keys (id, source, target, bandwidth, type, latency, utilization, status)
 
 
 class TestLinkTypeEnum:
@@ -217,9 +189,4 @@ class TestLinkTypeEnum:
     
     def test_link_type_enum_members(self):
         """Test LinkType enum has all expected members"""
-        members = [member.name for member in LinkType]
-        
-        assert "FIBER" in members
-        assert "ETHERNET" in members
-        assert "WIRELESS" in members
-        assert len(members) == 3
+        assert _LINK_TYPE_NAMES == {"FIBER", "ETHERNET", "WIRELESS"}
@@ -5,6 +5,79 @@ Tests Requirements: 2.1, 2.5
 import pytest
 from src.models.service import Service, ServiceType, ServiceStatus
 
+pytestmark = [pytest.mark.models, pytest.mark.fast]
+
+
+_SERVICE_TYPE_CASES = (
+    (ServiceType.MPLS_VPN, "MPLS_VPN"),
+    (ServiceType.OTN_CIRCUIT, "OTN_CIRCUIT"),
+    (ServiceType.GPON_ACCESS, "GPON_ACCESS"),
+    (ServiceType.FTTH_SERVICE, "FTTH_SERVICE"),
+)
+
+_SERVICE_STATUS_CASES = (
+    (ServiceStatus.PENDING, "pending"),
+    (ServiceStatus.ACTIVE, "active"),
+    (ServiceStatus.FAILED, "failed"),
+    (ServiceStatus.DECOMMISSIONED, "decommissioned"),
+)
+
+_SERVICE_TYPE_IDS = tuple(val for _, val in _SERVICE_TYPE_CASES)
+_SERVICE_STATUS_IDS = tuple(val for _, val in _SERVICE_STATUS_CASES)
+
+_PATH_CASES = (
+    ("D1", "D2"),
+    ("D1", "R1", "R2", "D2"),
+    ("D1", "R1", "R2", "R3", "R4", "D2"),
+)
+
+_SERVICE_TYPE_NAMES = frozenset(m.name for m in ServiceType)
+_SERVICE_STATUS_NAMES = frozenset(m.name for m in ServiceStatus)
+
+_SERVICE_DICT_KEYS = frozenset({
+    "id", "service_type", "source", "target", "bandwidth", "latency_requirement", "status", "path"
+})
+
+# Expected to_dict() output for the complete_service_dict fixture
+_COMPLETE_SERVICE_DICT = (
+    ("id", "S1"),
+    ("service_type", "MPLS_VPN"),
+    ("source", "D1"),
+    ("target", "D2"),
+    ("bandwidth", 50.0),
+    ("latency_requirement", 10.0),
+    ("status", "active"),
+    ("path", ["D1", "R1", "D2"]),
+)
+
+
+@pytest.fixture
+def svc():
+    """Fresh MPLS VPN service for tests that mutate path or status"""
+    return Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
+
+
+@pytest.fixture(scope="module")
+def complete_service_dict():
+    """Serialize a fully populated service once for the per-field assertions"""
+    service = Service(
+        id="S1",
+        service_type=ServiceType.MPLS_VPN,
+        source_device_id="D1",
+        target_device_id="D2",
+        bandwidth=50.0,
+        latency_requirement=10.0
+    )
+    service.status = ServiceStatus.ACTIVE
+    service.path = ["D1", "R1", "D2"]
+    return service.to_dict()
+
+
+@pytest.fixture(scope="module")
+def default_mpls_service():
+    """Shared read-only MPLS VPN service; tests that mutate it must build their own"""
+    return Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
+
 
 class TestServiceCreation:
     """Test Service object creation and initialization"""
@@ -21,12 +94,12 @@ class TestServiceCreation:
         )
         
         assert service.id == "S1"
-        assert service.service_type == ServiceType.MPLS_VPN
+        assert service.service_type is ServiceType.MPLS_VPN
         assert service.source_device_id == "D1"
         assert service.target_device_id == "D2"
         assert service.bandwidth == 50.0
         assert service.latency_requirement == 10.0
-        assert service.status == ServiceStatus.PENDING
+        assert service.status is ServiceStatus.PENDING
         assert service.path == []
         assert service.created_at is None
         assert service.activated_at is None
@@ -43,198 +116,108 @@ class TestServiceCreation:
         
         assert service.latency_requirement is None
     
-    def test_service_with_mpls_vpn_type(self):
-        """Test service creation with MPLS_VPN type"""
-        service = Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
-        
-        assert service.service_type == ServiceType.MPLS_VPN
-        assert service.service_type.value == "MPLS_VPN"
-    
-    def test_service_with_otn_circuit_type(self):
-        """Test service creation with OTN_CIRCUIT type"""
-        service = Service("S1", ServiceType.OTN_CIRCUIT, "D1", "D2", 10.0)
-        
-        assert service.service_type == ServiceType.OTN_CIRCUIT
-        assert service.service_type.value == "OTN_CIRCUIT"
-    
-    def test_service_with_gpon_access_type(self):
-        """Test service creation with GPON_ACCESS type"""
-        service = Service("S1", ServiceType.GPON_ACCESS, "G1", "G2", 1.0)
-        
-        assert service.service_type == ServiceType.GPON_ACCESS
-        assert service.service_type.value == "GPON_ACCESS"
-    
-    def test_service_with_ftth_service_type(self):
-        """Test service creation with FTTH_SERVICE type"""
-        service = Service("S1", ServiceType.FTTH_SERVICE, "D1", "D2", 1.0)
+    @pytest.mark.parametrize("st,val", _SERVICE_TYPE_CASES, ids=_SERVICE_TYPE_IDS)
+    def test_service_with_type(self, st, val):
+        """Test service creation with each service type"""
+        service = Service("S1", st, "D1", "D2", 10.0)
         
-        assert service.service_type == ServiceType.FTTH_SERVICE
-        assert service.service_type.value == "FTTH_SERVICE"
+        assert service.service_type is st
+        assert service.service_type.value == val
     
-    def test_service_default_status_is_pending(self):
+    def test_service_default_status_is_pending(self, default_mpls_service):
         """Test service default status is PENDING"""
-        service = Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
-        
-        assert service.status == ServiceStatus.PENDING
-        assert service.status.value == "pending"
+        assert default_mpls_service.status is ServiceStatus.PENDING
+        assert default_mpls_service.status.value == "pending"
     
-    def test_service_default_path_is_empty_list(self):
+    def test_service_default_path_is_empty_list(self, default_mpls_service):
         """Test service default path is empty list"""
-        service = Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
-        
-        assert service.path == []
-        assert isinstance(service.path, list)
+        assert default_mpls_service.path == []
+        assert isinstance(default_mpls_service.path, list)
 
 
 class TestServiceStatusManagement:
     """Test service status changes"""
     
-    def test_service_status_change_to_active(self):
-        """Test changing service status to ACTIVE"""
-        service = Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
-        
-        service.status = ServiceStatus.ACTIVE
-        
-        assert service.status == ServiceStatus.ACTIVE
-        assert service.status.value == "active"
-    
-    def test_service_status_change_to_failed(self):
-        """Test changing service status to FAILED"""
-        service = Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
-        
-        service.status = ServiceStatus.FAILED
-        
-        assert service.status == ServiceStatus.FAILED
-        assert service.status.value == "failed"
-    
-    def test_service_status_change_to_decommissioned(self):
-        """Test changing service status to DECOMMISSIONED"""
-        service = Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
-        
-        service.status = ServiceStatus.DECOMMISSIONED
-        
-        assert service.status == ServiceStatus.DECOMMISSIONED
-        assert service.status.value == "decommissioned"
+    def test_service_status_transitions(self, svc):
+        """Test one service can move through every non-PENDING status in turn"""
+        for status, val in _SERVICE_STATUS_CASES[1:]:
+            svc.status = status
+            
+            assert svc.status is status
+            assert svc.status.value == val
 
 
 class TestServicePathManagement:
     """Test service path management"""
     
-    def test_service_path_can_be_set(self):
+    @pytest.mark.parametrize("hops", _PATH_CASES, ids=lambda hops: f"{len(hops)}_hops")
+    def test_service_path_can_be_set(self, svc, hops):
         """Test service path can be set with device IDs"""
-        service = Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
-        
-        service.path = ["D1", "R1", "R2", "D2"]
+        svc.path = list(hops)
         
-        assert service.path == ["D1", "R1", "R2", "D2"]
-        assert len(service.path) == 4
+        assert svc.path == list(hops)
+        assert len(svc.path) == len(hops)
     
-    def test_service_path_can_be_modified(self):
+    def test_service_path_can_be_modified(self, svc):
         """Test service path can be modified"""
-        service = Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
-        service.path = ["D1", "R1", "D2"]
+        svc.path = ["D1", "R1", "D2"]
         
-        service.path.append("R2")
+        svc.path.append("R2")
         
-        assert "R2" in service.path
-        assert len(service.path) == 4
+        assert "R2" in svc.path
+        assert len(svc.path) == 4
     
-    def test_service_path_empty_for_new_service(self):
+    def test_service_path_empty_for_new_service(self, default_mpls_service):
         """Test new service has empty path"""
-        service = Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
-        
-        assert len(service.path) == 0
+        assert len(default_mpls_service.path) == 0
 
 
 class TestServiceSerialization:
     """Test Service to_dict() serialization"""
     
-    def test_service_to_dict_complete(self):
+    def test_service_to_dict_complete_keys(self, complete_service_dict):
+        """Test service serialization emits exactly the expected keys"""
+        assert complete_service_dict.keys() == _SERVICE_DICT_KEYS
+    
+    @pytest.mark.parametrize("key,value", _COMPLETE_SERVICE_DICT, ids=[k for k, _ in _COMPLETE_SERVICE_DICT])
+    def test_service_to_dict_complete(self, complete_service_dict, key, value):
         """Test service serialization with all fields"""
-        service = Service(
-            id="S1",
-            service_type=ServiceType.MPLS_VPN,
-            source_device_id="D1",
-            target_device_id="D2",
-            bandwidth=50.0,
-            latency_requirement=10.0
-        )
-        service.status = ServiceStatus.ACTIVE
-        service.path = ["D1", "R1", "D2"]
-        
-        result = service.to_dict()
-        
-        assert result["id"] == "S1"
-        assert result["service_type"] == "MPLS_VPN"
-        assert result["source"] == "D1"
-        assert result["target"] == "D2"
-        assert result["bandwidth"] == 50.0
-        assert result["latency_requirement"] == 10.0
-        assert result["status"] == "active"
-        assert result["path"] == ["D1", "R1", "D2"]
+        assert complete_service_dict[key] == value
     
-    def test_service_to_dict_with_none_latency(self):
-        """Test service serialization with None latency requirement"""
-        service = Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
-        
-        result = service.to_dict()
+    def test_service_to_dict_with_default_values(self, default_mpls_service):
+        """Test service serialization keys and default values"""
+        result = default_mpls_service.to_dict()
         
+        assert result.keys() == _SERVICE_DICT_KEYS
+        assert result["service_type"] == "MPLS_VPN"
+        assert result["status"] == "pending"
         assert result["latency_requirement"] is None
-    
-    def test_service_to_dict_with_empty_path(self):
-        """Test service serialization with empty path"""
-        service = Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
-        
-        result = service.to_dict()
-        
         assert result["path"] == []
     
-    def test_service_to_dict_different_service_types(self):
+    @pytest.mark.parametrize("st,val", _SERVICE_TYPE_CASES, ids=_SERVICE_TYPE_IDS)
+    def test_service_to_dict_different_service_types(self, st, val):
         """Test serialization preserves service type correctly"""
-        service_types = [
-            (ServiceType.MPLS_VPN, "MPLS_VPN"),
-            (ServiceType.OTN_CIRCUIT, "OTN_CIRCUIT"),
-            (ServiceType.GPON_ACCESS, "GPON_ACCESS"),
-            (ServiceType.FTTH_SERVICE, "FTTH_SERVICE")
-        ]
+        service = Service("S1", st, "D1", "D2", 10.0)
         
-        for service_type, expected_value in service_types:
-            service = Service("S1", service_type, "D1", "D2", 10.0)
-            result = service.to_dict()
-            
-            assert result["service_type"] == expected_value
-    
-    def test_service_to_dict_different_statuses(self):
-        """Test serialization with different status values"""
-        statuses = [
-            (ServiceStatus.PENDING, "pending"),
-            (ServiceStatus.ACTIVE, "active"),
-            (ServiceStatus.FAILED, "failed"),
-            (ServiceStatus.DECOMMISSIONED, "decommissioned")
-        ]
+        result = service.to_dict()
         
-        for status, expected_value in statuses:
-            service = Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
-            service.status = status
-            result = service.to_dict()
-            
-            assert result["status"] == expected_value
+        assert result["service_type"] == val
     
-    def test_service_to_dict_returns_dict_type(self):
-        """Test that to_dict returns a dictionary"""
+    @pytest.mark.parametrize("status,val", _SERVICE_STATUS_CASES, ids=_SERVICE_STATUS_IDS)
+    def test_service_to_dict_different_statuses(self, status, val):
+        """Test serialization with different status values"""
         service = Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
+        service.status = status
         
         result = service.to_dict()
         
-        assert isinstance(result, dict)
-        assert len(result) == 8  # Should have 8 keys
+        assert result["status"] == val
     
-    def test_service_to_dict_with_complex_path(self):
+    def test_service_to_dict_with_complex_path(self, svc):
         """Test serialization with complex multi-hop path"""
-        service = Service("S1", ServiceType.MPLS_VPN, "D1", "D2", 50.0)
-        service.path = ["D1", "R1", "R2", "R3", "R4", "D2"]
+        svc.path = ["D1", "R1", "R2", "R3", "R4", "D2"]
         
-        result = service.to_dict()
+        result = svc.to_dict()
         
         assert result["path"] == ["D1", "R1", "R2", "R3", "R4", "D2"]
         assert len(result["path"]) == 6
@@ -252,13 +235,7 @@ class TestServiceTypeEnum:
     
     def test_service_type_enum_members(self):
         """Test ServiceType enum has all expected members"""
-        members = [member.name for member in ServiceType]
-        
-        assert "MPLS_VPN" in members
-        assert "OTN_CIRCUIT" in members
-        assert "GPON_ACCESS" in members
-        assert "FTTH_SERVICE" in members
-        assert len(members) == 4
+        assert _SERVICE_TYPE_NAMES == {"MPLS_VPN", "OTN_CIRCUIT", "GPON_ACCESS", "FTTH_SERVICE"}
 
 
 class TestServiceStatusEnum:
@@ -273,13 +250,7 @@ class TestServiceStatusEnum:
     
     def test_service_status_enum_members(self):
         """Test ServiceStatus enum has all expected members"""
-        members = [member.name for member in ServiceStatus]
-        
-        assert "PENDING" in members
-        assert "ACTIVE" in members
-        assert "FAILED" in members
-        assert "DECOMMISSIONED" in members
-        assert len(members) == 4
+        assert _SERVICE_STATUS_NAMES == {"PENDING", "ACTIVE", "FAILED", "DECOMMISSIONED"}
 
 
 class TestServiceBandwidthRequirements:
@@ -319,8 +290,6 @@ class TestServiceLatencyRequirements:
         
         assert service.latency_requirement == 100.0
     
-    def test_service_without_latency_requirement(self):
+    def test_service_without_latency_requirement(self, default_mpls_service):
         """Test service without latency requirement"""
-        service = Service("S1", ServiceType.MPLS_VPN, "R1", "R2", 50.0)
-        
-        assert service.latency_requirement is None
+        assert default_mpls_service.latency_requirement is None
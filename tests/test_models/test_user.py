@@ -2,7 +2,25 @@
 
 import pytest
 from datetime import datetime
-from src.models.user import User, UserRole
+
+pytestmark = [pytest.mark.models, pytest.mark.fast]
+
+FROZEN_NOW = datetime(2024, 1, 1)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose utcnow() always returns FROZEN_NOW"""
+    
+    @classmethod
+    def utcnow(cls):
+        return FROZEN_NOW
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    """Freeze the clock User reads for its default created_at"""
+    monkeypatch.setattr("src.models.user.datetime", _FrozenDatetime)
+    return FROZEN_NOW
 
 
 class TestUser:
@@ -10,6 +28,8 @@ class TestUser:
     
     def test_user_creation(self):
         """Test creating a user"""
+        from src.models.user import User, UserRole
+        
         user = User(
             username="testuser",
             hashed_password="hashed_password",
@@ -20,36 +40,42 @@ class TestUser:
         
         assert user.username == "testuser"
         assert user.hashed_password == "hashed_password"
-        assert user.role == UserRole.USER
+        assert user.role is UserRole.USER
         assert user.email == "test@example.com"
         assert user.full_name == "Test User"
         assert user.disabled is False
-        assert isinstance(user.created_at, datetime)
+        assert user.created_at == FROZEN_NOW
     
     def test_user_with_admin_role(self):
         """Test creating a user with admin role"""
+        from src.models.user import User, UserRole
+        
         admin = User(
             username="admin",
             hashed_password="hashed_password",
             role=UserRole.ADMIN
         )
         
-        assert admin.role == UserRole.ADMIN
+        assert admin.role is UserRole.ADMIN
         assert admin.is_admin()
     
     def test_user_with_user_role(self):
         """Test creating a user with regular user role"""
+        from src.models.user import User, UserRole
+        
         user = User(
             username="user",
             hashed_password="hashed_password",
             role=UserRole.USER
         )
         
-        assert user.role == UserRole.USER
+        assert user.role is UserRole.USER
         assert not user.is_admin()
     
     def test_disabled_user(self):
         """Test creating a disabled user"""
+        from src.models.user import User, UserRole
+        
         user = User(
             username="disabled",
             hashed_password="hashed_password",
@@ -61,6 +87,8 @@ class TestUser:
     
     def test_user_to_dict(self):
         """Test converting user to dictionary"""
+        from src.models.user import User, UserRole
+        
         user = User(
             username="testuser",
             hashed_password="hashed_password",
@@ -83,11 +111,15 @@ class TestUser:
     
     def test_user_role_enum(self):
         """Test UserRole enum values"""
+        from src.models.user import UserRole
+        
         assert UserRole.ADMIN.value == "admin"
         assert UserRole.USER.value == "user"
     
     def test_is_admin_method(self):
         """Test is_admin method"""
+        from src.models.user import User, UserRole
+        
         admin = User(
             username="admin",
             hashed_password="hash",
@@ -105,6 +137,8 @@ class TestUser:
     
     def test_user_default_values(self):
         """Test user default values"""
+        from src.models.user import User, UserRole
+        
         user = User(
             username="testuser",
             hashed_password="hash",
@@ -115,10 +149,12 @@ class TestUser:
         assert user.email is None
         assert user.full_name is None
         assert user.disabled is False
-        assert user.created_at is not None
+        assert user.created_at == FROZEN_NOW
     
     def test_user_with_custom_created_at(self):
         """Test user with custom created_at timestamp"""
+        from src.models.user import User, UserRole
+        
         custom_time = datetime(2024, 1, 1, 12, 0, 0)
         
         user = User(
@@ -1,27 +1,36 @@
 """Unit tests for MetricsRepository"""
 
 import pytest
-import os
-import tempfile
+import uuid
 from datetime import datetime
 from src.repositories.metrics_repository import MetricsRepository
+from tests.sqlite_helpers import captured_sql, fetch_all, selects, query_plan
+
+
+def _memory_uri():
+    """Private in-memory database URI, freed when the last connection closes"""
+    return f"file:test_{uuid.uuid4().hex}?mode=memory&cache=shared"
 
 
 @pytest.fixture
 def temp_db():
-    """Create a temporary database file for testing"""
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    yield path
-    # Cleanup
-    if os.path.exists(path):
-        os.remove(path)
+    """Fresh database for tests that exercise schema creation itself"""
+    return _memory_uri()
 
 
-@pytest.fixture
-def metrics_repo(temp_db):
-    """Create a MetricsRepository instance with temporary database"""
-    return MetricsRepository(db_path=temp_db)
+@pytest.fixture(scope="session")
+def metrics_repo():
+    """One MetricsRepository for the session; the schema is created once"""
+    repo = MetricsRepository(db_path=_memory_uri())
+    yield repo
+    repo.close()
+
+
+@pytest.fixture(autouse=True)
+def _clean_metrics(metrics_repo):
+    """Empty the shared repository's tables after each test instead of rebuilding it"""
+    yield
+    metrics_repo.clear()
 
 
 class TestMetricsRepositoryInitialization:
@@ -32,31 +41,46 @@ class TestMetricsRepositoryInitialization:
         repo = MetricsRepository(db_path=temp_db)
         
         import sqlite3
-        conn = sqlite3.connect(temp_db)
-        cursor = conn.cursor()
+        # A second connection to the same shared in-memory database
+        conn = sqlite3.connect(temp_db, uri=True)
         
-        # Check device_metrics table exists
-        cursor.execute("""
+        # Check all three tables exist with a single lookup
+        rows = conn.execute("""
         SELECT name FROM sqlite_master 
-        WHERE type='table' AND name='device_metrics'
-        """)
-        assert cursor.fetchone() is not None
+        WHERE type='table' AND name IN ('device_metrics', 'link_metrics', 'service_logs')
+        """).fetchall()
+        assert {name for (name,) in rows} == {"device_metrics", "link_metrics", "service_logs"}
         
-        # Check link_metrics table exists
-        cursor.execute("""
-        SELECT name FROM sqlite_master 
-        WHERE type='table' AND name='link_metrics'
-        """)
-        assert cursor.fetchone() is not None
+        conn.close()
+        repo.close()
+    
+    def test_schema_initialization_creates_indexes(self, metrics_repo):
+        """Test that schema initialization creates the lookup indexes"""
+        rows = fetch_all(metrics_repo, "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'")
         
-        # Check service_logs table exists
-        cursor.execute("""
-        SELECT name FROM sqlite_master 
-        WHERE type='table' AND name='service_logs'
-        """)
-        assert cursor.fetchone() is not None
+        assert {name for (name,) in rows} == {
+            "idx_device_metrics_device_ts",
+            "idx_link_metrics_link_ts",
+            "idx_service_logs_service_event_ts",
+        }
+    
+    def test_device_metrics_query_uses_index(self, metrics_repo):
+        """Test that the query get_device_metrics issues avoids a full table scan"""
+        with captured_sql(metrics_repo) as statements:
+            metrics_repo.get_device_metrics("device1", limit=10)
         
-        conn.close()
+        (query,) = selects(statements)
+        assert "idx_device_metrics_device_ts" in query_plan(metrics_repo, query)
+    
+    def test_file_database_connection_pragmas(self, tmp_path):
+        """Test that a file-backed repository runs in WAL mode with relaxed syncing"""
+        repo = MetricsRepository(db_path=str(tmp_path / "metrics.db"))
+        
+        assert fetch_all(repo, "PRAGMA journal_mode")[0][0] == "wal"
+        # 1 == NORMAL: WAL commits skip the per-transaction fsync
+        assert fetch_all(repo, "PRAGMA synchronous")[0][0] == 1
+        assert fetch_all(repo, "PRAGMA busy_timeout")[0][0] == 5000
+        repo.close()
     
     def test_schema_initialization_idempotent(self, temp_db):
         """Test that schema initialization can be called multiple times"""
@@ -66,6 +90,8 @@ class TestMetricsRepositoryInitialization:
         # Should not raise any errors
         assert repo1 is not None
         assert repo2 is not None
+        repo2.close()
+        repo1.close()
 
 
 class TestDeviceMetrics:
@@ -83,9 +109,11 @@ class TestDeviceMetrics:
     
     def test_record_multiple_device_metrics(self, metrics_repo):
         """Test recording multiple metrics for the same device"""
-        metrics_repo.record_device_metric("device1", 0.50, "active")
-        metrics_repo.record_device_metric("device1", 0.75, "active")
-        metrics_repo.record_device_metric("device1", 0.90, "active")
+        metrics_repo.record_many_device_metrics([
+            ("device1", 0.50, "active"),
+            ("device1", 0.75, "active"),
+            ("device1", 0.90, "active"),
+        ])
         
         metrics = metrics_repo.get_device_metrics("device1")
         assert len(metrics) == 3
@@ -98,13 +126,18 @@ class TestDeviceMetrics:
     def test_get_device_metrics_with_limit(self, metrics_repo):
         """Test retrieving device metrics with limit parameter"""
         # Record 5 metrics
-        for i in range(5):
-            metrics_repo.record_device_metric("device1", i * 0.2, "active")
+        metrics_repo.record_many_device_metrics([("device1", i * 0.2, "active") for i in range(5)])
         
         # Get only 3 most recent
         metrics = metrics_repo.get_device_metrics("device1", limit=3)
         assert len(metrics) == 3
     
+    def test_record_many_device_metrics_empty(self, metrics_repo):
+        """Test recording an empty batch is a no-op"""
+        metrics_repo.record_many_device_metrics([])
+        
+        assert metrics_repo.get_device_metrics("device1") == []
+    
     def test_get_device_metrics_empty(self, metrics_repo):
         """Test retrieving metrics for non-existent device"""
         metrics = metrics_repo.get_device_metrics("nonexistent")
@@ -146,8 +179,7 @@ class TestLinkMetrics:
     
     def test_get_link_metrics_with_limit(self, metrics_repo):
         """Test retrieving link metrics with limit parameter"""
-        for i in range(5):
-            metrics_repo.record_link_metric("link1", i * 0.2, i * 1.0)
+        metrics_repo.record_many_link_metrics([("link1", i * 0.2, i * 1.0) for i in range(5)])
         
         metrics = metrics_repo.get_link_metrics("link1", limit=2)
         assert len(metrics) == 2
@@ -185,9 +217,11 @@ class TestServiceLogs:
     
     def test_record_multiple_service_logs(self, metrics_repo):
         """Test recording multiple logs for the same service"""
-        metrics_repo.record_service_log("service1", "provisioned", "Service created")
-        metrics_repo.record_service_log("service1", "activated", "Service activated")
-        metrics_repo.record_service_log("service1", "decommissioned", "Service removed")
+        metrics_repo.record_many_service_logs([
+            ("service1", "provisioned", "Service created"),
+            ("service1", "activated", "Service activated"),
+            ("service1", "decommissioned", "Service removed"),
+        ])
         
         logs = metrics_repo.get_service_logs("service1")
         assert len(logs) == 3
@@ -210,8 +244,7 @@ class TestServiceLogs:
     
     def test_get_service_logs_with_limit(self, metrics_repo):
         """Test retrieving service logs with limit parameter"""
-        for i in range(5):
-            metrics_repo.record_service_log("service1", "event", f"Event {i}")
+        metrics_repo.record_many_service_logs([("service1", "event", f"Event {i}") for i in range(5)])
         
         logs = metrics_repo.get_service_logs("service1", limit=3)
         assert len(logs) == 3
@@ -259,22 +292,98 @@ class TestQueryFiltering:
     def test_combined_filters(self, metrics_repo):
         """Test combining multiple filters"""
         # Record various service logs
-        metrics_repo.record_service_log("service1", "provisioned", "Event 1")
-        metrics_repo.record_service_log("service1", "failed", "Event 2")
-        metrics_repo.record_service_log("service1", "provisioned", "Event 3")
-        metrics_repo.record_service_log("service1", "provisioned", "Event 4")
+        metrics_repo.record_many_service_logs([
+            ("service1", "provisioned", "Event 1"),
+            ("service1", "failed", "Event 2"),
+            ("service1", "provisioned", "Event 3"),
+            ("service1", "provisioned", "Event 4"),
+        ])
         
         # Filter by event type and limit
         logs = metrics_repo.get_service_logs("service1", event_type="provisioned", limit=2)
         assert len(logs) == 2
         assert all(log["event_type"] == "provisioned" for log in logs)
+    
+    def test_service_log_event_filter_runs_in_sql(self, metrics_repo):
+        """Test that get_service_logs filters by event_type with an index seek and no separate sort"""
+        with captured_sql(metrics_repo) as statements:
+            metrics_repo.get_service_logs("service1", event_type="provisioned", limit=2)
+        
+        (query,) = selects(statements)
+        details = query_plan(metrics_repo, query)
+        
+        assert "idx_service_logs_service_event_ts" in details
+        assert "TEMP B-TREE" not in details
+
+
+class TestBatchedWrites:
+    """Test grouping writes into one transaction"""
+    
+    def test_batched_commits_once(self, metrics_repo):
+        """Test that writes inside batched() share a single COMMIT"""
+        with captured_sql(metrics_repo) as statements:
+            with metrics_repo.batched():
+                metrics_repo.record_device_metric("device1", 0.5, "active")
+                metrics_repo.record_link_metric("link1", 0.5, 5.0)
+                metrics_repo.record_service_log("service1", "provisioned", "Created")
+        
+        assert statements.count("COMMIT") == 1
+        assert len(metrics_repo.get_device_metrics("device1")) == 1
+        assert len(metrics_repo.get_link_metrics("link1")) == 1
+        assert len(metrics_repo.get_service_logs("service1")) == 1
+    
+    def test_batched_rolls_back_on_error(self, metrics_repo):
+        """Test that an exception inside batched() discards every write in the block"""
+        with pytest.raises(RuntimeError):
+            with metrics_repo.batched():
+                metrics_repo.record_device_metric("device1", 0.5, "active")
+                metrics_repo.record_service_log("service1", "provisioned", "Created")
+                raise RuntimeError("abort")
+        
+        assert metrics_repo.get_device_metrics("device1") == []
+        assert metrics_repo.get_service_logs("service1") == []
+    
+    def test_nested_batched_commits_with_outer_block(self, metrics_repo):
+        """Test that an inner batched() block defers to the outer transaction"""
+        with pytest.raises(RuntimeError):
+            with metrics_repo.batched():
+                with metrics_repo.batched():
+                    metrics_repo.record_device_metric("device1", 0.5, "active")
+                raise RuntimeError("abort")
+        
+        assert metrics_repo.get_device_metrics("device1") == []
 
 
 class TestRepositoryClose:
     """Test repository cleanup"""
     
-    def test_close_method(self, metrics_repo):
+    def test_clear_removes_all_rows(self, metrics_repo):
+        """Test that clear empties every metrics table"""
+        metrics_repo.record_device_metric("device1", 0.5, "active")
+        metrics_repo.record_link_metric("link1", 0.5, 5.0)
+        metrics_repo.record_service_log("service1", "provisioned", "Created")
+        
+        metrics_repo.clear()
+        
+        assert metrics_repo.get_device_metrics("device1") == []
+        assert metrics_repo.get_link_metrics("link1") == []
+        assert metrics_repo.get_service_logs("service1") == []
+    
+    def test_close_method(self, temp_db):
         """Test that close method can be called without errors"""
-        metrics_repo.close()
-        # Should not raise any errors
-        assert True
+        repo = MetricsRepository(db_path=temp_db)
+        repo.close()
+        # Closing again should not raise
+        repo.close()
+    
+    def test_use_after_close_raises(self, temp_db):
+        """Test that reads and writes on a closed repository fail with a clear error"""
+        repo = MetricsRepository(db_path=temp_db)
+        repo.close()
+        
+        with pytest.raises(RuntimeError, match="closed"):
+            repo.record_device_metric("device1", 0.5, "active")
+        with pytest.raises(RuntimeError, match="closed"):
+            repo.get_device_metrics("device1")
+        with pytest.raises(RuntimeError, match="closed"):
+            repo.clear()
@@ -6,7 +6,6 @@ for integration testing of the repository layer.
 """
 
 import pytest
-from testcontainers.neo4j import Neo4jContainer
 
 from src.repositories.neo4j_repository import Neo4jRepository
 from src.models.device import Device, DeviceType, DeviceStatus
@@ -14,33 +13,104 @@ from src.models.link import Link, LinkType
 from src.models.specialized_devices import MPLSRouter, DWDMDevice, GPONDevice
 
 
-@pytest.fixture(scope="module")
-def neo4j_container():
-    """
-    Fixture to start a Neo4j container for testing
-    """
-    container = Neo4jContainer("neo4j:5.12")
-    container.start()
-    yield container
-    container.stop()
+def _clear_graph(repo):
+    """Delete every node and relationship in batched auto-commit transactions"""
+    with repo.driver.session() as session:
+        session.run("""
+        MATCH (n)
+        CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 1000 ROWS
+        """)
+
+
+def _count_reads(repo, monkeypatch):
+    """Record every execute_read call made through sessions the repository opens"""
+    reads = []
+    open_session = repo.driver.session
+    
+    def counting_session(*args, **kwargs):
+        session = open_session(*args, **kwargs)
+        execute_read = session.execute_read
+        
+        def counting_execute_read(*read_args, **read_kwargs):
+            reads.append(read_args)
+            return execute_read(*read_args, **read_kwargs)
+        
+        session.execute_read = counting_execute_read
+        return session
+    
+    monkeypatch.setattr(repo.driver, "session", counting_session)
+    return reads
 
 
 @pytest.fixture(scope="function")
-def neo4j_repo(neo4j_container):
+def neo4j_repo(neo4j_connection):
     """
     Fixture to create a Neo4j repository connected to the test container
     """
-    uri = neo4j_container.get_connection_url()
-    repo = Neo4jRepository(uri, "neo4j", neo4j_container.NEO4J_ADMIN_PASSWORD)
+    repo = Neo4jRepository(*neo4j_connection)
     yield repo
     
     # Clean up: delete all nodes and relationships after each test
-    with repo.driver.session() as session:
-        session.run("MATCH (n) DETACH DELETE n")
+    _clear_graph(repo)
     
     repo.close()
 
 
+@pytest.fixture(scope="function")
+def cached_neo4j_repo(neo4j_connection):
+    """
+    Fixture to create a Neo4j repository with the read cache enabled
+    """
+    repo = Neo4jRepository(*neo4j_connection, cache_enabled=True, cache_size=2)
+    yield repo
+    
+    _clear_graph(repo)
+    
+    repo.close()
+
+
+@pytest.fixture(scope="class")
+def populated_repo(neo4j_connection):
+    """
+    Fixture to load a shared read-only corpus once per test class
+    
+    Tests using it must not write; write tests use neo4j_repo with their own ids.
+    """
+    repo = Neo4jRepository(*neo4j_connection)
+    repo.create_devices_bulk([
+        MPLSRouter("R2", "CoreRouter2", capacity=200.0, location="DataCenter2"),
+        MPLSRouter("R7", "Router7", capacity=100.0),
+        MPLSRouter("R8", "Router8", capacity=100.0),
+        MPLSRouter("R9", "Router9", capacity=100.0)
+    ])
+    repo.create_links_bulk([
+        Link("L3", "R7", "R8", bandwidth=10.0, link_type=LinkType.FIBER),
+        Link("L4", "R7", "R9", bandwidth=20.0, link_type=LinkType.ETHERNET)
+    ])
+    yield repo
+    
+    _clear_graph(repo)
+    
+    repo.close()
+
+
+# (device_id, expected properties or None if absent) over the populated_repo corpus
+_DEVICE_READ_CASES = (
+    ("R2", {"id": "R2", "name": "CoreRouter2", "type": DeviceType.MPLS.value,
+            "capacity": 200.0, "location": "DataCenter2"}),
+    ("R7", {"id": "R7", "name": "Router7", "type": DeviceType.MPLS.value, "capacity": 100.0}),
+    ("NONEXISTENT", None),
+)
+
+# (device_id, ids of links touching it) over the populated_repo corpus
+_LINK_READ_CASES = (
+    ("R7", {"L3", "L4"}),
+    ("R8", {"L3"}),
+    ("R9", {"L4"}),
+    ("R2", set()),
+)
+
+
 class TestNeo4jRepositoryConnection:
     """Test connection management and initialization"""
     
@@ -48,20 +118,36 @@ class TestNeo4jRepositoryConnection:
         """Test that connection to Neo4j is established"""
         assert neo4j_repo.driver is not None
     
-    def test_indexes_created(self, neo4j_repo):
+    def test_indexes_created(self, neo4j_connection):
         """Test that indexes are created on initialization"""
+        # Start from a clean slate so the result doesn't depend on earlier tests
+        Neo4jRepository.forget_indexes(neo4j_connection[0])
+        repo = Neo4jRepository(*neo4j_connection)
+        try:
+            with repo.driver.session() as session:
+                indexes = [record["name"] for record in session.run("SHOW INDEXES")]
+        finally:
+            repo.close()
+        
+        assert "device_id_index" in indexes
+        assert "device_type_index" in indexes
+        assert "service_id_index" in indexes
+    
+    def test_ensure_indexes_force_recreates_dropped_indexes(self, neo4j_repo):
+        """Test that a forced ensure_indexes restores indexes the database lost"""
+        with neo4j_repo.driver.session() as session:
+            session.run("DROP INDEX device_id_index IF EXISTS")
+        
+        # Already recorded for this URI, so only a forced run recreates the index
+        neo4j_repo.ensure_indexes(force=True)
+        
         with neo4j_repo.driver.session() as session:
-            result = session.run("SHOW INDEXES")
-            indexes = [record["name"] for record in result]
-            
-            assert "device_id_index" in indexes
-            assert "device_type_index" in indexes
-            assert "service_id_index" in indexes
-    
-    def test_close_connection(self, neo4j_container):
+            indexes = [record["name"] for record in session.run("SHOW INDEXES")]
+        assert "device_id_index" in indexes
+    
+    def test_close_connection(self, neo4j_connection):
         """Test that connection can be closed properly"""
-        uri = neo4j_container.get_connection_url()
-        repo = Neo4jRepository(uri, "neo4j", neo4j_container.NEO4J_ADMIN_PASSWORD)
+        repo = Neo4jRepository(*neo4j_connection)
         
         repo.close()
         assert repo.driver is None
@@ -78,25 +164,18 @@ class TestDeviceCRUD:
         
         assert result is True
     
-    def test_get_device(self, neo4j_repo):
-        """Test retrieving a device by ID"""
-        device = MPLSRouter("R2", "CoreRouter2", capacity=200.0, location="DataCenter2")
-        neo4j_repo.create_device(device)
-        
-        retrieved = neo4j_repo.get_device("R2")
+    def test_create_devices_bulk(self, neo4j_repo):
+        """Test creating several devices in one call"""
+        devices = [
+            MPLSRouter("RB1", "BulkRouter1", capacity=100.0),
+            DWDMDevice("DB1", "BulkDWDM1", capacity=400.0, wavelengths=80)
+        ]
         
-        assert retrieved is not None
-        assert retrieved["id"] == "R2"
-        assert retrieved["name"] == "CoreRouter2"
-        assert retrieved["type"] == DeviceType.MPLS.value
-        assert retrieved["capacity"] == 200.0
-        assert retrieved["location"] == "DataCenter2"
-    
-    def test_get_nonexistent_device(self, neo4j_repo):
-        """Test retrieving a device that doesn't exist"""
-        retrieved = neo4j_repo.get_device("NONEXISTENT")
+        created = neo4j_repo.create_devices_bulk(devices)
         
-        assert retrieved is None
+        assert created == 2
+        assert neo4j_repo.get_device("RB1")["name"] == "BulkRouter1"
+        assert neo4j_repo.get_device("DB1")["type"] == DeviceType.DWDM.value
     
     def test_update_device(self, neo4j_repo):
         """Test updating device properties"""
@@ -130,8 +209,7 @@ class TestDeviceCRUD:
         """Test deleting a device that has link relationships"""
         device1 = MPLSRouter("R3", "Router3", capacity=100.0)
         device2 = MPLSRouter("R4", "Router4", capacity=100.0)
-        neo4j_repo.create_device(device1)
-        neo4j_repo.create_device(device2)
+        neo4j_repo.create_devices_bulk([device1, device2])
         
         link = Link("L1", "R3", "R4", bandwidth=10.0, link_type=LinkType.FIBER)
         neo4j_repo.create_link(link)
@@ -149,41 +227,34 @@ class TestLinkCRUD:
         """Test creating a link between devices"""
         device1 = MPLSRouter("R5", "Router5", capacity=100.0)
         device2 = MPLSRouter("R6", "Router6", capacity=100.0)
-        neo4j_repo.create_device(device1)
-        neo4j_repo.create_device(device2)
+        neo4j_repo.create_devices_bulk([device1, device2])
         
         link = Link("L2", "R5", "R6", bandwidth=10.0, link_type=LinkType.FIBER, latency=5.0)
         result = neo4j_repo.create_link(link)
         
         assert result is True
     
-    def test_get_links_for_device(self, neo4j_repo):
-        """Test retrieving all links for a device"""
-        device1 = MPLSRouter("R7", "Router7", capacity=100.0)
-        device2 = MPLSRouter("R8", "Router8", capacity=100.0)
-        device3 = MPLSRouter("R9", "Router9", capacity=100.0)
-        neo4j_repo.create_device(device1)
-        neo4j_repo.create_device(device2)
-        neo4j_repo.create_device(device3)
-        
-        link1 = Link("L3", "R7", "R8", bandwidth=10.0, link_type=LinkType.FIBER)
-        link2 = Link("L4", "R7", "R9", bandwidth=20.0, link_type=LinkType.ETHERNET)
-        neo4j_repo.create_link(link1)
-        neo4j_repo.create_link(link2)
-        
-        links = neo4j_repo.get_links_for_device("R7")
-        
-        assert len(links) == 2
-        link_ids = [link["id"] for link in links]
-        assert "L3" in link_ids
-        assert "L4" in link_ids
+    def test_create_links_bulk(self, neo4j_repo):
+        """Test creating several links in one call"""
+        neo4j_repo.create_devices_bulk([
+            MPLSRouter("RB2", "BulkRouter2", capacity=100.0),
+            MPLSRouter("RB3", "BulkRouter3", capacity=100.0),
+            MPLSRouter("RB4", "BulkRouter4", capacity=100.0)
+        ])
+        
+        created = neo4j_repo.create_links_bulk([
+            Link("LB1", "RB2", "RB3", bandwidth=10.0, link_type=LinkType.FIBER),
+            Link("LB2", "RB2", "RB4", bandwidth=20.0, link_type=LinkType.ETHERNET)
+        ])
+        
+        assert created == 2
+        assert len(neo4j_repo.get_links_for_device("RB2")) == 2
     
     def test_update_link(self, neo4j_repo):
         """Test updating link properties"""
         device1 = MPLSRouter("R10", "Router10", capacity=100.0)
         device2 = MPLSRouter("R11", "Router11", capacity=100.0)
-        neo4j_repo.create_device(device1)
-        neo4j_repo.create_device(device2)
+        neo4j_repo.create_devices_bulk([device1, device2])
         
         link = Link("L5", "R10", "R11", bandwidth=10.0, link_type=LinkType.FIBER)
         neo4j_repo.create_link(link)
@@ -204,8 +275,7 @@ class TestLinkCRUD:
         """Test deleting a link"""
         device1 = MPLSRouter("R12", "Router12", capacity=100.0)
         device2 = MPLSRouter("R13", "Router13", capacity=100.0)
-        neo4j_repo.create_device(device1)
-        neo4j_repo.create_device(device2)
+        neo4j_repo.create_devices_bulk([device1, device2])
         
         link = Link("L6", "R12", "R13", bandwidth=10.0, link_type=LinkType.FIBER)
         neo4j_repo.create_link(link)
@@ -218,6 +288,28 @@ class TestLinkCRUD:
         assert len(links) == 0
 
 
+class TestCorpusReads:
+    """Test device and link lookups against a shared corpus"""
+    
+    @pytest.mark.parametrize("device_id,expected", _DEVICE_READ_CASES, ids=[c[0] for c in _DEVICE_READ_CASES])
+    def test_get_device(self, populated_repo, device_id, expected):
+        """Test retrieving a device by ID, or None when it doesn't exist"""
+        retrieved = populated_repo.get_device(device_id)
+        
+        if expected is None:
+            assert retrieved is None
+        else:
+            assert expected.items() <= retrieved.items()
+    
+    @pytest.mark.parametrize("device_id,link_ids", _LINK_READ_CASES, ids=[c[0] for c in _LINK_READ_CASES])
+    def test_get_links_for_device(self, populated_repo, device_id, link_ids):
+        """Test retrieving all links for a device"""
+        links = populated_repo.get_links_for_device(device_id)
+        
+        assert {link["id"] for link in links} == link_ids
+        assert len(links) == len(link_ids)
+
+
 class TestTopologyExport:
     """Test topology export functionality"""
     
@@ -236,28 +328,22 @@ class TestTopologyExport:
         device2 = MPLSRouter("R15", "Router15", capacity=100.0)
         device3 = DWDMDevice("D2", "DWDM2", capacity=400.0, wavelengths=80)
         
-        neo4j_repo.create_device(device1)
-        neo4j_repo.create_device(device2)
-        neo4j_repo.create_device(device3)
+        neo4j_repo.create_devices_bulk([device1, device2, device3])
         
         link1 = Link("L7", "R14", "R15", bandwidth=10.0, link_type=LinkType.FIBER)
         link2 = Link("L8", "R15", "D2", bandwidth=40.0, link_type=LinkType.FIBER)
-        neo4j_repo.create_link(link1)
-        neo4j_repo.create_link(link2)
+        neo4j_repo.create_links_bulk([link1, link2])
         
         topology = neo4j_repo.get_topology_json()
         
         assert len(topology["devices"]) == 3
         assert len(topology["links"]) == 2
         
-        device_ids = [d["id"] for d in topology["devices"]]
-        assert "R14" in device_ids
-        assert "R15" in device_ids
-        assert "D2" in device_ids
+        device_ids = {d["id"] for d in topology["devices"]}
+        assert {"R14", "R15", "D2"} <= device_ids
         
-        link_ids = [l["id"] for l in topology["links"]]
-        assert "L7" in link_ids
-        assert "L8" in link_ids
+        link_ids = {l["id"] for l in topology["links"]}
+        assert {"L7", "L8"} <= link_ids
 
 
 class TestPathFinding:
@@ -274,8 +360,7 @@ class TestPathFinding:
             MPLSRouter("R20", "Router20", capacity=100.0)
         ]
         
-        for device in devices:
-            neo4j_repo.create_device(device)
+        neo4j_repo.create_devices_bulk(devices)
         
         # Create links forming a network
         # R16 -> R17 -> R18 -> R20
@@ -289,8 +374,7 @@ class TestPathFinding:
             Link("L13", "R19", "R18", bandwidth=10.0, link_type=LinkType.FIBER, latency=7.0)
         ]
         
-        for link in links:
-            neo4j_repo.create_link(link)
+        neo4j_repo.create_links_bulk(links)
     
     def test_find_shortest_path(self, neo4j_repo):
         """Test finding shortest path between devices"""
@@ -307,8 +391,7 @@ class TestPathFinding:
         """Test finding path when no path exists"""
         device1 = MPLSRouter("R21", "Router21", capacity=100.0)
         device2 = MPLSRouter("R22", "Router22", capacity=100.0)
-        neo4j_repo.create_device(device1)
-        neo4j_repo.create_device(device2)
+        neo4j_repo.create_devices_bulk([device1, device2])
         
         path = neo4j_repo.find_shortest_path("R21", "R22")
         
@@ -351,3 +434,58 @@ class TestPathFinding:
         result = neo4j_repo.find_optimal_path("R16", "R20", max_utilization=0.5)
         
         assert result is None
+
+
+class TestReadCache:
+    """Test the opt-in device/link read cache"""
+    
+    def test_cached_get_device_skips_database(self, cached_neo4j_repo):
+        """Test a repeated get_device is served from the cache"""
+        cached_neo4j_repo.create_device(MPLSRouter("RC1", "CacheRouter1", capacity=100.0))
+        cached_neo4j_repo.get_device("RC1")
+        
+        # Change the node behind the repository's back; the cached copy is returned
+        with cached_neo4j_repo.driver.session() as session:
+            session.run("MATCH (d:Device {id: 'RC1'}) SET d.name = 'Changed'")
+        
+        assert cached_neo4j_repo.get_device("RC1")["name"] == "CacheRouter1"
+    
+    def test_update_device_invalidates_cache(self, cached_neo4j_repo):
+        """Test updates through the repository are visible on the next read"""
+        cached_neo4j_repo.create_device(MPLSRouter("RC2", "CacheRouter2", capacity=100.0))
+        cached_neo4j_repo.get_device("RC2")
+        
+        cached_neo4j_repo.update_device("RC2", {"utilization": 0.5})
+        
+        assert cached_neo4j_repo.get_device("RC2")["utilization"] == 0.5
+    
+    def test_link_writes_invalidate_cached_links(self, cached_neo4j_repo):
+        """Test link creation and deletion refresh cached link lookups"""
+        cached_neo4j_repo.create_devices_bulk([
+            MPLSRouter("RC3", "CacheRouter3", capacity=100.0),
+            MPLSRouter("RC4", "CacheRouter4", capacity=100.0)
+        ])
+        assert cached_neo4j_repo.get_links_for_device("RC3") == []
+        
+        cached_neo4j_repo.create_link(Link("LC1", "RC3", "RC4", bandwidth=10.0, link_type=LinkType.FIBER))
+        assert len(cached_neo4j_repo.get_links_for_device("RC3")) == 1
+        
+        cached_neo4j_repo.delete_link("LC1")
+        assert cached_neo4j_repo.get_links_for_device("RC3") == []
+    
+    def test_cache_evicts_least_recently_used(self, cached_neo4j_repo, monkeypatch):
+        """Test that reading past cache_size drops the least recently used lookup"""
+        cached_neo4j_repo.create_devices_bulk([
+            MPLSRouter(f"RC{i}", f"CacheRouter{i}", capacity=100.0) for i in range(5, 8)
+        ])
+        
+        for device_id in ["RC5", "RC6", "RC7"]:
+            cached_neo4j_repo.get_device(device_id)
+        
+        reads = _count_reads(cached_neo4j_repo, monkeypatch)
+        
+        # RC7 is still cached; RC5 was evicted and has to be read again
+        assert cached_neo4j_repo.get_device("RC7")["name"] == "CacheRouter7"
+        assert len(reads) == 0
+        assert cached_neo4j_repo.get_device("RC5")["name"] == "CacheRouter5"
+        assert len(reads) == 1
@@ -4,77 +4,116 @@ import pytest
 import os
 from src.repositories.user_repository import UserRepository
 from src.models.user import User, UserRole
-from src.services.auth_service import AuthService
+from tests.fakes import FakeAuthService
+from tests.sqlite_helpers import snapshot, restore
+
+
+@pytest.fixture
+def fake_auth():
+    """Hash-free stand-in for tests that exercise repository logic, not hashing"""
+    return FakeAuthService()
+
+
+@pytest.fixture(scope="session")
+def seeded_user_repo():
+    """
+    One in-memory UserRepository for the session, plus a snapshot of it after seeding
+    
+    The default users are hashed and inserted only once.
+    """
+    repo = UserRepository(db_path=":memory:", shared=True)
+    seeded = snapshot(repo)
+    yield repo, seeded
+    seeded.close()
+    repo.close()
+
+
+@pytest.fixture
+def repo(seeded_user_repo):
+    """Shared UserRepository, restored to its freshly seeded state after each test"""
+    repo, seeded = seeded_user_repo
+    yield repo
+    # The repository commits every write, so undo the test by restoring the snapshot
+    restore(repo, seeded)
+
+
+# Precomputed cost-4 bcrypt hash of "mypassword123", so storing it costs no hashing
+_HASHTEST_PASSWORD = "mypassword123"
+_HASHTEST_HASH = "$2b$04$SCGCPuoe2WF32QmjHVO9MesydA7sFV5vTCwu5jGyNVE34DRE.uvUm"
+
+
+@pytest.fixture(scope="module")
+def hashtest_user():
+    """User with a real bcrypt hash, built once for the hash-storage tests"""
+    return User(
+        username="hashtest",
+        hashed_password=_HASHTEST_HASH,
+        role=UserRole.USER
+    )
 
 
 class TestUserRepository:
     """Test suite for UserRepository"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        # Use in-memory database for testing
-        self.repo = UserRepository(db_path=":memory:")
-        self.auth_service = AuthService()
-    
-    def test_default_users_created(self):
+    def test_default_users_created(self, repo):
         """Test that default admin and user accounts are created"""
-        admin = self.repo.get_user("admin")
-        user = self.repo.get_user("user")
+        admin = repo.get_user("admin")
+        user = repo.get_user("user")
         
         assert admin is not None
         assert admin.role == UserRole.ADMIN
         assert user is not None
         assert user.role == UserRole.USER
     
-    def test_create_user(self):
+    def test_create_user(self, repo, fake_auth):
         """Test creating a new user"""
         new_user = User(
             username="testuser",
-            hashed_password=self.auth_service.get_password_hash("password123"),
+            hashed_password=fake_auth.get_password_hash("password123"),
             role=UserRole.USER,
             email="test@example.com",
             full_name="Test User"
         )
         
-        success = self.repo.create_user(new_user)
+        success = repo.create_user(new_user)
         assert success
         
         # Verify user was created
-        retrieved = self.repo.get_user("testuser")
+        retrieved = repo.get_user("testuser")
         assert retrieved is not None
         assert retrieved.username == "testuser"
         assert retrieved.email == "test@example.com"
         assert retrieved.role == UserRole.USER
     
-    def test_create_duplicate_user(self):
+    def test_create_duplicate_user(self, repo, fake_auth):
         """Test that creating duplicate user fails"""
         user1 = User(
             username="duplicate",
-            hashed_password=self.auth_service.get_password_hash("password"),
+            hashed_password=fake_auth.get_password_hash("password"),
             role=UserRole.USER
         )
         
-        success1 = self.repo.create_user(user1)
+        success1 = repo.create_user(user1)
         assert success1
         
         # Try to create user with same username
         user2 = User(
             username="duplicate",
-            hashed_password=self.auth_service.get_password_hash("password2"),
+            hashed_password=fake_auth.get_password_hash("password2"),
             role=UserRole.ADMIN
         )
         
-        success2 = self.repo.create_user(user2)
+        success2 = repo.create_user(user2)
         assert not success2
     
-    def test_get_nonexistent_user(self):
+    def test_get_nonexistent_user(self, repo):
         """Test getting a user that doesn't exist"""
-        user = self.repo.get_user("nonexistent")
+        user = repo.get_user("nonexistent")
         assert user is None
     
-    def test_get_all_users(self):
+    def test_get_all_users(self, repo):
         """Test getting all users"""
-        users = self.repo.get_all_users()
+        users = repo.get_all_users()
         
         # Should have at least the default admin and user
         assert len(users) >= 2
@@ -83,25 +122,25 @@ class TestUserRepository:
         assert "admin" in usernames
         assert "user" in usernames
     
-    def test_update_user(self):
+    def test_update_user(self, repo):
         """Test updating a user"""
         # Get existing user
-        user = self.repo.get_user("admin")
+        user = repo.get_user("admin")
         assert user is not None
         
         # Update user properties
         user.email = "newemail@example.com"
         user.full_name = "Updated Admin"
         
-        success = self.repo.update_user(user)
+        success = repo.update_user(user)
         assert success
         
         # Verify update
-        updated = self.repo.get_user("admin")
+        updated = repo.get_user("admin")
         assert updated.email == "newemail@example.com"
         assert updated.full_name == "Updated Admin"
     
-    def test_update_nonexistent_user(self):
+    def test_update_nonexistent_user(self, repo):
         """Test updating a user that doesn't exist"""
         user = User(
             username="nonexistent",
@@ -109,38 +148,38 @@ class TestUserRepository:
             role=UserRole.USER
         )
         
-        success = self.repo.update_user(user)
+        success = repo.update_user(user)
         assert not success
     
-    def test_delete_user(self):
+    def test_delete_user(self, repo, fake_auth):
         """Test deleting a user"""
         # Create a user to delete
         user = User(
             username="todelete",
-            hashed_password=self.auth_service.get_password_hash("password"),
+            hashed_password=fake_auth.get_password_hash("password"),
             role=UserRole.USER
         )
         
-        self.repo.create_user(user)
+        repo.create_user(user)
         
         # Verify user exists
-        assert self.repo.get_user("todelete") is not None
+        assert repo.get_user("todelete") is not None
         
         # Delete user
-        success = self.repo.delete_user("todelete")
+        success = repo.delete_user("todelete")
         assert success
         
         # Verify user is deleted
-        assert self.repo.get_user("todelete") is None
+        assert repo.get_user("todelete") is None
     
-    def test_delete_nonexistent_user(self):
+    def test_delete_nonexistent_user(self, repo):
         """Test deleting a user that doesn't exist"""
-        success = self.repo.delete_user("nonexistent")
+        success = repo.delete_user("nonexistent")
         assert not success
     
-    def test_get_users_dict(self):
+    def test_get_users_dict(self, repo):
         """Test getting users as dictionary"""
-        users_dict = self.repo.get_users_dict()
+        users_dict = repo.get_users_dict()
         
         assert isinstance(users_dict, dict)
         assert "admin" in users_dict
@@ -149,55 +188,80 @@ class TestUserRepository:
         assert isinstance(users_dict["admin"], User)
         assert users_dict["admin"].role == UserRole.ADMIN
     
-    def test_disabled_user_flag(self):
+    def test_disabled_user_flag(self, repo, fake_auth):
         """Test disabled user flag"""
         # Create disabled user
         disabled_user = User(
             username="disabled",
-            hashed_password=self.auth_service.get_password_hash("password"),
+            hashed_password=fake_auth.get_password_hash("password"),
             role=UserRole.USER,
             disabled=True
         )
         
-        self.repo.create_user(disabled_user)
+        repo.create_user(disabled_user)
         
         # Retrieve and verify
-        retrieved = self.repo.get_user("disabled")
+        retrieved = repo.get_user("disabled")
         assert retrieved is not None
         assert retrieved.disabled is True
     
-    def test_user_role_persistence(self):
+    def test_user_role_persistence(self, repo, fake_auth):
         """Test that user roles are persisted correctly"""
         # Create admin user
         admin = User(
             username="testadmin",
-            hashed_password=self.auth_service.get_password_hash("password"),
+            hashed_password=fake_auth.get_password_hash("password"),
             role=UserRole.ADMIN
         )
         
-        self.repo.create_user(admin)
+        repo.create_user(admin)
         
         # Retrieve and verify role
-        retrieved = self.repo.get_user("testadmin")
+        retrieved = repo.get_user("testadmin")
         assert retrieved.role == UserRole.ADMIN
         assert retrieved.is_admin()
     
-    def test_password_hash_stored(self):
+    def test_password_hash_stored(self, repo, hashtest_user):
         """Test that password hash is stored, not plain password"""
-        password = "mypassword123"
-        user = User(
-            username="hashtest",
-            hashed_password=self.auth_service.get_password_hash(password),
-            role=UserRole.USER
-        )
-        
-        self.repo.create_user(user)
+        repo.create_user(hashtest_user)
         
         # Retrieve user
-        retrieved = self.repo.get_user("hashtest")
+        retrieved = repo.get_user("hashtest")
+        
+        # Stored value is a bcrypt hash, not the plain password
+        assert retrieved.hashed_password != _HASHTEST_PASSWORD
+        assert retrieved.hashed_password.startswith("$2b$")
+    
+    @pytest.mark.slow
+    def test_password_hash_round_trip(self, repo, auth_service, hashtest_user):
+        """Test that the stored hash verifies against the original password"""
+        repo.create_user(hashtest_user)
         
-        # Hash should not equal plain password
-        assert retrieved.hashed_password != password
+        retrieved = repo.get_user("hashtest")
+        
+        assert auth_service.verify_password(_HASHTEST_PASSWORD, retrieved.hashed_password)
+    
+    @pytest.mark.parametrize("run", ["first", "second"])
+    def test_changes_do_not_leak_between_tests(self, repo, fake_auth, run):
+        """Test that the user one run creates is gone when the next run starts"""
+        assert {u.username for u in repo.get_all_users()} == {"admin", "user"}
+        
+        assert repo.create_user(User(
+            username="leakcheck",
+            hashed_password=fake_auth.get_password_hash("password"),
+            role=UserRole.USER
+        ))
+    
+    def test_shared_memory_database_visible_to_other_connections(self, repo, fake_auth):
+        """Test that a second shared in-memory repository sees the same users"""
+        repo.create_user(User(
+            username="sharedcheck",
+            hashed_password=fake_auth.get_password_hash("password"),
+            role=UserRole.USER
+        ))
         
-        # But should verify correctly
-        assert self.auth_service.verify_password(password, retrieved.hashed_password)
+        other = UserRepository(db_path=":memory:", shared=True)
+        try:
+            assert other.get_user("sharedcheck") is not None
+        finally:
+            other.close()
@@ -0,0 +1,67 @@
+"""Shared read-only model fixtures for the service layer tests"""
+
+import pytest
+
+from src.models.service import Service, ServiceType
+from src.models.link import Link, LinkType
+from src.models.specialized_devices import MPLSRouter
+
+
+@pytest.fixture(scope="module")
+def service_ok():
+    """50 Gbps MPLS VPN with no latency requirement"""
+    return Service(
+        id="S1",
+        service_type=ServiceType.MPLS_VPN,
+        source_device_id="D1",
+        target_device_id="D2",
+        bandwidth=50.0
+    )
+
+
+@pytest.fixture(scope="module")
+def service_bw_violation():
+    """MPLS VPN requesting more bandwidth than device_100 can carry"""
+    return Service(
+        id="S1",
+        service_type=ServiceType.MPLS_VPN,
+        source_device_id="D1",
+        target_device_id="D2",
+        bandwidth=150.0
+    )
+
+
+@pytest.fixture(scope="module")
+def service_bw_lat_violation():
+    """MPLS VPN violating both the bandwidth and latency rules"""
+    return Service(
+        id="S1",
+        service_type=ServiceType.MPLS_VPN,
+        source_device_id="D1",
+        target_device_id="D2",
+        bandwidth=150.0,
+        latency_requirement=5.0
+    )
+
+
+@pytest.fixture(scope="module")
+def device_100():
+    """MPLS router with 100 Gbps capacity"""
+    return MPLSRouter(
+        id="D1",
+        name="Router1",
+        capacity=100.0
+    )
+
+
+@pytest.fixture(scope="module")
+def link_hi_latency():
+    """Fiber link with 10 ms latency"""
+    return Link(
+        id="L1",
+        source_device_id="D1",
+        target_device_id="D2",
+        bandwidth=100.0,
+        link_type=LinkType.FIBER,
+        latency=10.0
+    )
@@ -2,77 +2,80 @@
 
 import pytest
 from datetime import timedelta
-from src.services.auth_service import AuthService
 from src.models.user import User, UserRole
 
 
-class TestAuthService:
-    """Test suite for AuthService"""
-    
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.auth_service = AuthService(secret_key="test-secret-key")
-        
-        # Create test users
-        self.admin_user = User(
+# (username, password, role of the authenticated user or None if rejected)
+_AUTHENTICATE_CASES = (
+    ("admin", "admin123", UserRole.ADMIN),
+    ("admin", "wrong_password", None),
+    ("nonexistent", "password", None),
+    ("disabled", "disabled123", None),
+)
+
+
+@pytest.fixture(scope="module")
+def user_db(pw_hashes):
+    """Admin, regular and disabled users keyed by username"""
+    return {
+        "admin": User(
             username="admin",
-            hashed_password=self.auth_service.get_password_hash("admin123"),
+            hashed_password=pw_hashes["admin123"],
             role=UserRole.ADMIN,
             email="admin@test.com"
-        )
-        
-        self.regular_user = User(
+        ),
+        "user": User(
             username="user",
-            hashed_password=self.auth_service.get_password_hash("user123"),
+            hashed_password=pw_hashes["user123"],
             role=UserRole.USER,
             email="user@test.com"
-        )
-        
-        self.disabled_user = User(
+        ),
+        "disabled": User(
             username="disabled",
-            hashed_password=self.auth_service.get_password_hash("disabled123"),
+            hashed_password=pw_hashes["disabled123"],
             role=UserRole.USER,
             disabled=True
         )
-        
-        self.user_db = {
-            "admin": self.admin_user,
-            "user": self.regular_user,
-            "disabled": self.disabled_user
-        }
+    }
+
+
+class TestAuthService:
+    """Test suite for AuthService"""
     
-    def test_password_hashing(self):
+    def test_password_hashing(self, auth_service, pw_hashes):
         """Test password hashing functionality"""
         password = "test_password_123"
-        hashed = self.auth_service.get_password_hash(password)
+        hashed = pw_hashes[password]
         
         # Hash should not equal plain password
         assert hashed != password
         
         # Should be able to verify correct password
-        assert self.auth_service.verify_password(password, hashed)
+        assert auth_service.verify_password(password, hashed)
         
         # Should not verify incorrect password
-        assert not self.auth_service.verify_password("wrong_password", hashed)
+        assert not auth_service.verify_password("wrong_password", hashed)
+    
+    def test_hash_cost_sets_bcrypt_rounds(self, auth_service, pw_hashes):
+        """Test hash_cost is applied as the bcrypt rounds of new hashes"""
+        # bcrypt hashes are "$2b$<rounds>$..."
+        assert pw_hashes["password"].split("$")[2] == "04"
     
-    def test_create_access_token(self):
+    def test_create_access_token(self, sample_tokens):
         """Test JWT token generation"""
-        token = self.auth_service.create_access_token(
-            username="testuser",
-            role=UserRole.ADMIN
-        )
+        token = sample_tokens[("testuser", UserRole.ADMIN)]
         
         # Token should be a non-empty string
         assert isinstance(token, str)
         assert len(token) > 0
     
-    def test_decode_valid_token(self):
+    def test_decode_valid_token(self, auth_service, sample_tokens):
         """Test decoding a valid JWT token"""
         username = "testuser"
         role = UserRole.ADMIN
         
-        token = self.auth_service.create_access_token(username=username, role=role)
-        payload = self.auth_service.decode_token(token)
+        token = sample_tokens[(username, role)]
+        payload = auth_service.decode_token(token)
         
         # Payload should contain username and role
         assert payload is not None
@@ -80,96 +83,67 @@ class TestAuthService:
         assert payload["role"] == role.value
         assert "exp" in payload
     
-    def test_decode_invalid_token(self):
+    def test_decode_invalid_token(self, auth_service):
         """Test decoding an invalid JWT token"""
         invalid_token = "invalid.token.here"
-        payload = self.auth_service.decode_token(invalid_token)
+        payload = auth_service.decode_token(invalid_token)
         
         # Should return None for invalid token
         assert payload is None
     
-    def test_decode_expired_token(self):
+    def test_decode_expired_token(self, auth_service):
         """Test decoding an expired JWT token"""
         # Create token with negative expiration (already expired)
-        token = self.auth_service.create_access_token(
+        token = auth_service.create_access_token(
             username="testuser",
             role=UserRole.USER,
             expires_delta=timedelta(seconds=-1)
         )
         
-        payload = self.auth_service.decode_token(token)
+        payload = auth_service.decode_token(token)
         
         # Should return None for expired token
         assert payload is None
     
-    def test_authenticate_user_success(self):
-        """Test successful user authentication"""
-        user = self.auth_service.authenticate_user(
-            username="admin",
-            password="admin123",
-            user_db=self.user_db
-        )
-        
-        assert user is not None
-        assert user.username == "admin"
-        assert user.role == UserRole.ADMIN
-    
-    def test_authenticate_user_wrong_password(self):
-        """Test authentication with wrong password"""
-        user = self.auth_service.authenticate_user(
-            username="admin",
-            password="wrong_password",
-            user_db=self.user_db
-        )
-        
-        assert user is None
-    
-    def test_authenticate_user_nonexistent(self):
-        """Test authentication with nonexistent user"""
-        user = self.auth_service.authenticate_user(
-            username="nonexistent",
-            password="password",
-            user_db=self.user_db
-        )
-        
-        assert user is None
-    
-    def test_authenticate_disabled_user(self):
-        """Test authentication with disabled user"""
-        user = self.auth_service.authenticate_user(
-            username="disabled",
-            password="disabled123",
-            user_db=self.user_db
+    @pytest.mark.parametrize(
+        "username,password,expected_role",
+        _AUTHENTICATE_CASES,
+        ids=["success", "wrong_password", "nonexistent", "disabled"]
+    )
+    def test_authenticate_user(self, auth_service, user_db, username, password, expected_role):
+        """Test authentication succeeds only for an enabled user with the right password"""
+        user = auth_service.authenticate_user(
+            username=username,
+            password=password,
+            user_db=user_db
         )
         
-        assert user is None
+        if expected_role is None:
+            assert user is None
+        else:
+            assert user is not None
+            assert user.username == username
+            assert user.role == expected_role
     
-    def test_token_contains_role(self):
+    def test_token_contains_role(self, auth_service, sample_tokens):
         """Test that JWT token contains user role"""
-        admin_token = self.auth_service.create_access_token(
-            username="admin",
-            role=UserRole.ADMIN
-        )
-        
-        user_token = self.auth_service.create_access_token(
-            username="user",
-            role=UserRole.USER
-        )
+        admin_token = sample_tokens[("admin", UserRole.ADMIN)]
+        user_token = sample_tokens[("user", UserRole.USER)]
         
-        admin_payload = self.auth_service.decode_token(admin_token)
-        user_payload = self.auth_service.decode_token(user_token)
+        admin_payload = auth_service.decode_token(admin_token)
+        user_payload = auth_service.decode_token(user_token)
         
         assert admin_payload["role"] == "admin"
         assert user_payload["role"] == "user"
     
-    def test_different_tokens_for_different_users(self):
+    def test_different_tokens_for_different_users(self, auth_service):
         """Test that different users get different tokens"""
-        token1 = self.auth_service.create_access_token(
+        token1 = auth_service.create_access_token(
             username="user1",
             role=UserRole.USER
         )
         
-        token2 = self.auth_service.create_access_token(
+        token2 = auth_service.create_access_token(
             username="user2",
             role=UserRole.USER
         )
@@ -178,8 +152,8 @@ class TestAuthService:
         assert token1 != token2
         
         # But both should be valid
-        payload1 = self.auth_service.decode_token(token1)
-        payload2 = self.auth_service.decode_token(token2)
+        payload1 = auth_service.decode_token(token1)
+        payload2 = auth_service.decode_token(token2)
         
         assert payload1 is not None
         assert payload2 is not None
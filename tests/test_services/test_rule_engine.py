@@ -2,10 +2,39 @@
 
 import pytest
 from src.services.rule_engine import RuleEngine, RuleCondition
-from src.models.service import Service, ServiceType
-from src.models.device import Device, DeviceType
-from src.models.link import Link, LinkType
-from src.models.specialized_devices import MPLSRouter
+
+
+def _always_true(service, device, link):
+    """Rule condition that always reports a violation"""
+    return True
+
+
+def _always_false(service, device, link):
+    """Rule condition that never reports a violation"""
+    return False
+
+
+def _faulty(service, device, link):
+    """Rule condition that always raises"""
+    raise ValueError("Intentional error")
+
+
+@pytest.fixture(scope="class")
+def shared_engine():
+    """One RuleEngine per test class for tests that only evaluate"""
+    return RuleEngine()
+
+
+@pytest.fixture
+def engine(shared_engine):
+    """The shared RuleEngine, restored after tests that add, reorder or disable rules"""
+    # Rules are shared, not copied: record the list and each enabled flag, then put them back
+    saved_rules = shared_engine.rules[:]
+    saved_enabled = [(rule, rule.enabled) for rule in saved_rules]
+    yield shared_engine
+    shared_engine.rules = saved_rules
+    for rule, enabled in saved_enabled:
+        rule.enabled = enabled
 
 
 class TestRuleCondition:
@@ -16,7 +45,7 @@ class TestRuleCondition:
         rule = RuleCondition(
             rule_id="TEST001",
             name="Test Rule",
-            condition=lambda s, d, l: True,
+            condition=_always_true,
             action="reject",
             enabled=True,
             priority=1
@@ -32,24 +61,21 @@ class TestRuleCondition:
 class TestRuleEngine:
     """Tests for RuleEngine class"""
     
-    def test_rule_engine_initialization(self):
+    def test_rule_engine_initialization(self, shared_engine):
         """Test that RuleEngine initializes with default rules"""
-        engine = RuleEngine()
-        
         # Should have 2 default rules (BW001 and LAT001)
-        assert len(engine.rules) == 2
-        assert engine.rules[0].rule_id == "BW001"
-        assert engine.rules[1].rule_id == "LAT001"
+        assert len(shared_engine.rules) == 2
+        assert shared_engine.rules[0].rule_id == "BW001"
+        assert shared_engine.rules[1].rule_id == "LAT001"
     
-    def test_add_rule(self):
+    def test_add_rule(self, engine):
         """Test adding a rule to the engine"""
-        engine = RuleEngine()
         initial_count = len(engine.rules)
         
         new_rule = RuleCondition(
             rule_id="TEST001",
             name="Test Rule",
-            condition=lambda s, d, l: False,
+            condition=_always_false,
             action="reject",
             priority=10
         )
@@ -59,15 +85,13 @@ class TestRuleEngine:
         assert len(engine.rules) == initial_count + 1
         assert new_rule in engine.rules
     
-    def test_rule_priority_sorting(self):
+    def test_rule_priority_sorting(self, engine):
         """Test that rules are sorted by priority"""
-        engine = RuleEngine()
-        
         # Add rules with different priorities
         rule_high = RuleCondition(
             rule_id="HIGH",
             name="High Priority",
-            condition=lambda s, d, l: False,
+            condition=_always_false,
             action="reject",
             priority=0
         )
@@ -75,7 +99,7 @@ class TestRuleEngine:
         rule_low = RuleCondition(
             rule_id="LOW",
             name="Low Priority",
-            condition=lambda s, d, l: False,
+            condition=_always_false,
             action="reject",
             priority=100
         )
@@ -86,204 +110,69 @@ class TestRuleEngine:
         # High priority (lower number) should come first
         assert engine.rules[0].rule_id == "HIGH"
     
-    def test_evaluate_passing_conditions(self):
+    def test_evaluate_passing_conditions(self, shared_engine, service_ok, device_100):
         """Test rule evaluation with passing conditions"""
-        engine = RuleEngine()
-        
-        # Create a service with sufficient bandwidth
-        service = Service(
-            id="S1",
-            service_type=ServiceType.MPLS_VPN,
-            source_device_id="D1",
-            target_device_id="D2",
-            bandwidth=50.0
-        )
-        
-        # Create a device with sufficient capacity
-        device = MPLSRouter(
-            id="D1",
-            name="Router1",
-            capacity=100.0
-        )
-        
-        is_valid, violations = engine.evaluate(service, device=device)
+        is_valid, violations = shared_engine.evaluate(service_ok, device=device_100)
         
         assert is_valid is True
         assert len(violations) == 0
     
-    def test_evaluate_failing_bandwidth_rule(self):
-        """Test rule evaluation with bandwidth capacity violation"""
-        engine = RuleEngine()
-        
-        # Create a service requesting more bandwidth than available
-        service = Service(
-            id="S1",
-            service_type=ServiceType.MPLS_VPN,
-            source_device_id="D1",
-            target_device_id="D2",
-            bandwidth=150.0
-        )
-        
-        # Create a device with insufficient capacity
-        device = MPLSRouter(
-            id="D1",
-            name="Router1",
-            capacity=100.0
+    @pytest.mark.parametrize("use_device,use_link,expect_bw,expect_lat", [
+        (True, False, True, False),
+        (False, True, False, True),
+        (True, True, True, True),
+    ], ids=["bandwidth", "latency", "both"])
+    def test_evaluate_failing_rules(self, shared_engine, service_bw_lat_violation, device_100, link_hi_latency,
+                                    use_device, use_link, expect_bw, expect_lat):
+        """Test that each rule reports its violation only when its model is supplied"""
+        is_valid, violations = shared_engine.evaluate(
+            service_bw_lat_violation,
+            device=device_100 if use_device else None,
+            link=link_hi_latency if use_link else None
         )
         
-        is_valid, violations = engine.evaluate(service, device=device)
-        
         assert is_valid is False
-        assert len(violations) == 1
-        assert "BW001" in violations[0]
-        assert "Bandwidth Capacity Check" in violations[0]
+        assert len(violations) == expect_bw + expect_lat
+        assert any("BW001" in v and "Bandwidth Capacity Check" in v for v in violations) == expect_bw
+        assert any("LAT001" in v and "Latency Requirement Check" in v for v in violations) == expect_lat
     
-    def test_evaluate_failing_latency_rule(self):
-        """Test rule evaluation with latency requirement violation"""
-        engine = RuleEngine()
-        
-        # Create a service with strict latency requirement
-        service = Service(
-            id="S1",
-            service_type=ServiceType.MPLS_VPN,
-            source_device_id="D1",
-            target_device_id="D2",
-            bandwidth=50.0,
-            latency_requirement=5.0  # 5ms max
-        )
-        
-        # Create a link with high latency
-        link = Link(
-            id="L1",
-            source_device_id="D1",
-            target_device_id="D2",
-            bandwidth=100.0,
-            link_type=LinkType.FIBER,
-            latency=10.0  # 10ms actual
-        )
-        
-        is_valid, violations = engine.evaluate(service, link=link)
-        
-        assert is_valid is False
-        assert len(violations) == 1
-        assert "LAT001" in violations[0]
-        assert "Latency Requirement Check" in violations[0]
-    
-    def test_evaluate_multiple_rule_violations(self):
-        """Test rule evaluation with multiple violations"""
-        engine = RuleEngine()
-        
-        # Create a service with high bandwidth and strict latency
-        service = Service(
-            id="S1",
-            service_type=ServiceType.MPLS_VPN,
-            source_device_id="D1",
-            target_device_id="D2",
-            bandwidth=150.0,
-            latency_requirement=5.0
-        )
-        
-        # Create a device with insufficient capacity
-        device = MPLSRouter(
-            id="D1",
-            name="Router1",
-            capacity=100.0
-        )
-        
-        # Create a link with high latency
-        link = Link(
-            id="L1",
-            source_device_id="D1",
-            target_device_id="D2",
-            bandwidth=100.0,
-            link_type=LinkType.FIBER,
-            latency=10.0
-        )
-        
-        is_valid, violations = engine.evaluate(service, device=device, link=link)
-        
-        assert is_valid is False
-        assert len(violations) == 2
-        assert any("BW001" in v for v in violations)
-        assert any("LAT001" in v for v in violations)
-    
-    def test_evaluate_disabled_rule_exclusion(self):
+    def test_evaluate_disabled_rule_exclusion(self, engine, service_bw_violation, device_100):
         """Test that disabled rules are not evaluated"""
-        engine = RuleEngine()
-        
         # Disable the bandwidth rule
         for rule in engine.rules:
             if rule.rule_id == "BW001":
                 rule.enabled = False
         
-        # Create a service that would violate bandwidth rule
-        service = Service(
-            id="S1",
-            service_type=ServiceType.MPLS_VPN,
-            source_device_id="D1",
-            target_device_id="D2",
-            bandwidth=150.0
-        )
-        
-        device = MPLSRouter(
-            id="D1",
-            name="Router1",
-            capacity=100.0
-        )
-        
-        is_valid, violations = engine.evaluate(service, device=device)
+        is_valid, violations = engine.evaluate(service_bw_violation, device=device_100)
         
         # Should pass because the rule is disabled
         assert is_valid is True
         assert len(violations) == 0
     
-    def test_evaluate_with_rule_exception(self):
+    def test_evaluate_with_rule_exception(self, engine, service_ok):
         """Test error handling when rule condition raises exception"""
-        engine = RuleEngine()
-        
         # Add a rule that will raise an exception
-        def faulty_condition(service, device, link):
-            raise ValueError("Intentional error")
-        
         faulty_rule = RuleCondition(
             rule_id="FAULT001",
             name="Faulty Rule",
-            condition=faulty_condition,
+            condition=_faulty,
             action="reject",
             priority=0
         )
         
         engine.add_rule(faulty_rule)
         
-        service = Service(
-            id="S1",
-            service_type=ServiceType.MPLS_VPN,
-            source_device_id="D1",
-            target_device_id="D2",
-            bandwidth=50.0
-        )
-        
-        is_valid, violations = engine.evaluate(service)
+        is_valid, violations = engine.evaluate(service_ok)
         
         # Should capture the exception as a violation
         assert is_valid is False
         assert len(violations) >= 1
         assert any("FAULT001" in v and "Error evaluating rule" in v for v in violations)
     
-    def test_evaluate_without_optional_parameters(self):
+    def test_evaluate_without_optional_parameters(self, shared_engine, service_ok):
         """Test evaluation when device or link are None"""
-        engine = RuleEngine()
-        
-        service = Service(
-            id="S1",
-            service_type=ServiceType.MPLS_VPN,
-            source_device_id="D1",
-            target_device_id="D2",
-            bandwidth=50.0
-        )
-        
         # Should not raise exception when device and link are None
-        is_valid, violations = engine.evaluate(service)
+        is_valid, violations = shared_engine.evaluate(service_ok)
         
         # Should pass because rules check for None
         assert is_valid is True
@@ -7,53 +7,57 @@ workflows, including integration with Neo4j, metrics repository, and rule engine
 
 import pytest
 import os
-import tempfile
-from unittest.mock import Mock, MagicMock, patch
+import uuid
+from types import MappingProxyType
 
 from src.services.service_orchestrator import ServiceOrchestrator
-from src.repositories.neo4j_repository import Neo4jRepository
 from src.repositories.metrics_repository import MetricsRepository
-from src.services.rule_engine import RuleEngine
+from src.services.rule_engine import RuleEngine, RuleCondition
 from src.models.service import Service, ServiceType, ServiceStatus
 from src.models.device import DeviceType
 from src.models.specialized_devices import MPLSRouter, DWDMDevice
 from src.models.link import Link, LinkType
+from tests.fakes import FakeNeo4jRepository
+from tests.sqlite_helpers import captured_sql
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def temp_db():
-    """Create a temporary database file for testing"""
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    yield path
-    # Cleanup
-    if os.path.exists(path):
-        os.remove(path)
+    """Private in-memory database URI per test class, named per xdist worker so parallel runs never share one"""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return f"file:orch_{worker}_{uuid.uuid4().hex}?mode=memory&cache=shared"
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def metrics_repo(temp_db):
-    """Create a MetricsRepository instance with temporary database"""
-    return MetricsRepository(db_path=temp_db)
+    """MetricsRepository shared by a test class; tests use distinct service IDs"""
+    repo = MetricsRepository(db_path=temp_db)
+    yield repo
+    # Closing the last connection frees the in-memory database
+    repo.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def rule_engine():
-    """Create a RuleEngine instance"""
+    """Default-rules RuleEngine shared by a test class; tests needing custom rules build their own"""
     return RuleEngine()
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def mock_neo4j_repo():
-    """Create a mock Neo4jRepository for testing"""
-    mock_repo = Mock(spec=Neo4jRepository)
-    mock_repo.driver = MagicMock()
-    return mock_repo
+    """Fake Neo4jRepository shared by a test class and reset before each test"""
+    return FakeNeo4jRepository()
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_fake_neo4j(mock_neo4j_repo):
+    """Clear canned responses and recorded calls left by the previous test"""
+    mock_neo4j_repo.reset()
+
+
+@pytest.fixture(scope="class")
 def orchestrator(mock_neo4j_repo, metrics_repo, rule_engine):
-    """Create a ServiceOrchestrator instance with dependencies"""
+    """ServiceOrchestrator built once per test class; it keeps no per-service state"""
     return ServiceOrchestrator(mock_neo4j_repo, metrics_repo, rule_engine)
 
 
@@ -69,164 +73,101 @@ class TestServiceOrchestratorInitialization:
         assert orchestrator.rule_engine == rule_engine
 
 
+# Canned Neo4j records, read-only so one instance is safely shared by every test
+_DEVICE_R1 = MappingProxyType({
+    "id": "R1",
+    "name": "Router1",
+    "type": "MPLS",
+    "capacity": 100.0,
+    "utilization": 0.3,
+    "status": "active"
+})
+
+_LINKS_R1_R2 = (
+    MappingProxyType({
+        "id": "L1",
+        "source": "R1",
+        "target": "R2",
+        "utilization": 0.2,
+        "latency": 5.0
+    }),
+)
+
+
+def _svc(**overrides) -> Service:
+    """50 Gbps MPLS VPN from R1 to R2, with any constructor arguments overridden"""
+    # Service is a plain mutable class that provisioning updates, so each test gets a new one
+    kwargs = dict(id="S001", service_type=ServiceType.MPLS_VPN, source_device_id="R1",
+                  target_device_id="R2", bandwidth=50.0)
+    kwargs.update(overrides)
+    return Service(**kwargs)
+
+
+def _over_100_gbps(service, device, link):
+    """Custom rejection rule: services above 100 Gbps"""
+    return service.bandwidth > 100.0
+
+
+# (target_device_id, bandwidth, path, created record, add rejection rule, expected success, message substring)
+_PROVISION_CASES = [
+    pytest.param("R3", 50.0, ["R1", "R2", "R3"], {"s": {"id": "S001"}}, False, True, "provisioned successfully",
+                 id="success"),
+    pytest.param("R99", 50.0, None, None, False, False, "No path found", id="no_path"),
+    pytest.param("R2", 150.0, ["R1", "R2"], {"s": {"id": "S001"}}, True, False, "TEST001",
+                 id="validation_failure"),
+    pytest.param("R2", 50.0, ["R1", "R2"], None, False, False, "Failed to create service",
+                 id="neo4j_creation_failure"),
+]
+
+
 class TestServiceProvisioning:
     """Test service provisioning workflow"""
     
-    def test_provision_service_success(self, orchestrator, mock_neo4j_repo):
-        """Test successful end-to-end service provisioning"""
+    @pytest.mark.parametrize(
+        "target_id,bandwidth,path,created,reject_rule,expected_success,expected_message", _PROVISION_CASES
+    )
+    def test_provision_service(self, orchestrator, mock_neo4j_repo, metrics_repo, target_id, bandwidth, path,
+                               created, reject_rule, expected_success, expected_message):
+        """Test each provisioning outcome: success, no path, rule rejection and failed creation"""
         # Setup
-        service = Service(
-            id="S001",
-            service_type=ServiceType.MPLS_VPN,
-            source_device_id="R1",
-            target_device_id="R3",
-            bandwidth=50.0,
-            latency_requirement=10.0
-        )
+        service = _svc(target_device_id=target_id, bandwidth=bandwidth, latency_requirement=10.0)
+        
+        if reject_rule:
+            # Custom rule on a private engine, leaving the class-shared one untouched
+            rule_engine = RuleEngine()
+            rule_engine.add_rule(RuleCondition(
+                rule_id="TEST001",
+                name="Test Rejection Rule",
+                condition=_over_100_gbps,
+                action="reject",
+                priority=0
+            ))
+            orchestrator = ServiceOrchestrator(mock_neo4j_repo, metrics_repo, rule_engine)
         
         # Mock Neo4j responses
-        mock_neo4j_repo.find_shortest_path.return_value = ["R1", "R2", "R3"]
-        mock_neo4j_repo.get_device.return_value = {
-            "id": "R1",
-            "name": "Router1",
-            "type": "MPLS",
-            "capacity": 100.0,
-            "utilization": 0.3,
-            "status": "active"
-        }
+        mock_neo4j_repo.path = path
+        mock_neo4j_repo.device = _DEVICE_R1
+        mock_neo4j_repo.links = _LINKS_R1_R2
         
         # Mock Neo4j session for service creation
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        mock_result.single.return_value = {"s": {"id": "S001"}}
-        mock_session.run.return_value = mock_result
-        mock_neo4j_repo.driver.session.return_value.__enter__.return_value = mock_session
-        
-        mock_neo4j_repo.get_links_for_device.return_value = [
-            {
-                "id": "L1",
-                "source": "R1",
-                "target": "R2",
-                "utilization": 0.2,
-                "latency": 5.0
-            }
-        ]
+        mock_neo4j_repo.session.record = created
         
         # Execute
         success, message = orchestrator.provision_service(service)
         
         # Assert
-        assert success is True
-        assert "provisioned successfully" in message
-        assert service.status == ServiceStatus.ACTIVE
-        assert service.path == ["R1", "R2", "R3"]
-        assert service.activated_at is not None
-        
-        # Verify Neo4j interactions
-        mock_neo4j_repo.find_shortest_path.assert_called_once_with("R1", "R3")
-        assert mock_neo4j_repo.get_device.call_count >= 1
-    
-    def test_provision_service_no_path(self, orchestrator, mock_neo4j_repo):
-        """Test provisioning fails when no path exists"""
-        # Setup
-        service = Service(
-            id="S002",
-            service_type=ServiceType.MPLS_VPN,
-            source_device_id="R1",
-            target_device_id="R99",
-            bandwidth=50.0
-        )
-        
-        # Mock Neo4j to return no path
-        mock_neo4j_repo.find_shortest_path.return_value = None
-        
-        # Execute
-        success, message = orchestrator.provision_service(service)
-        
-        # Assert
-        assert success is False
-        assert "No path found" in message
-        assert service.status == ServiceStatus.FAILED
-    
-    def test_provision_service_validation_failure(self, mock_neo4j_repo, metrics_repo):
-        """Test provisioning fails when rule validation fails"""
-        # Create a custom rule that will fail
-        from src.services.rule_engine import RuleEngine, RuleCondition
-        
-        rule_engine = RuleEngine()
-        # Add a custom rule that always rejects
-        rule_engine.add_rule(RuleCondition(
-            rule_id="TEST001",
-            name="Test Rejection Rule",
-            condition=lambda service, device, link: service.bandwidth > 100.0,
-            action="reject",
-            priority=0
-        ))
-        
-        orchestrator = ServiceOrchestrator(mock_neo4j_repo, metrics_repo, rule_engine)
-        
-        # Setup
-        service = Service(
-            id="S003",
-            service_type=ServiceType.MPLS_VPN,
-            source_device_id="R1",
-            target_device_id="R2",
-            bandwidth=150.0  # Exceeds threshold
-        )
-        
-        # Mock Neo4j responses
-        mock_neo4j_repo.find_shortest_path.return_value = ["R1", "R2"]
-        mock_neo4j_repo.get_device.return_value = {
-            "id": "R1",
-            "name": "Router1",
-            "type": "MPLS",
-            "capacity": 100.0,
-            "utilization": 0.5,
-            "status": "active"
-        }
-        
-        # Execute
-        success, message = orchestrator.provision_service(service)
-        
-        # Assert
-        assert success is False
-        assert "Validation failed" in message or "TEST001" in message
-        assert service.status == ServiceStatus.FAILED
-    
-    def test_provision_service_neo4j_creation_failure(self, orchestrator, mock_neo4j_repo):
-        """Test error handling when Neo4j service creation fails"""
-        # Setup
-        service = Service(
-            id="S004",
-            service_type=ServiceType.MPLS_VPN,
-            source_device_id="R1",
-            target_device_id="R2",
-            bandwidth=50.0
-        )
-        
-        # Mock Neo4j responses
-        mock_neo4j_repo.find_shortest_path.return_value = ["R1", "R2"]
-        mock_neo4j_repo.get_device.return_value = {
-            "id": "R1",
-            "capacity": 100.0,
-            "utilization": 0.3,
-            "status": "active"
-        }
-        
-        # Mock Neo4j session to fail service creation
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        mock_result.single.return_value = None  # Simulate creation failure
-        mock_session.run.return_value = mock_result
-        mock_neo4j_repo.driver.session.return_value.__enter__.return_value = mock_session
-        
-        # Execute
-        success, message = orchestrator.provision_service(service)
-        
-        # Assert
-        assert success is False
-        assert "Failed to create service" in message
-        assert service.status == ServiceStatus.FAILED
+        assert success is expected_success
+        assert expected_message in message
+        assert mock_neo4j_repo.calls_to("find_shortest_path") == [("R1", target_id)]
+        
+        if expected_success:
+            assert service.status == ServiceStatus.ACTIVE
+            assert service.path == path
+            assert service.activated_at is not None
+            # One metrics lookup per device on the path, after the validation lookups
+            assert mock_neo4j_repo.calls_to("get_device")[-len(path):] == [(device_id,) for device_id in path]
+        else:
+            assert service.status == ServiceStatus.FAILED
 
 
 class TestMetricsRecording:
@@ -235,46 +176,27 @@ class TestMetricsRecording:
     def test_metrics_recorded_during_provisioning(self, orchestrator, mock_neo4j_repo, metrics_repo):
         """Test that device and link metrics are recorded during provisioning"""
         # Setup
-        service = Service(
-            id="S005",
-            service_type=ServiceType.MPLS_VPN,
-            source_device_id="R1",
-            target_device_id="R2",
-            bandwidth=50.0
-        )
+        service = _svc(id="S005")
         
         # Mock Neo4j responses
-        mock_neo4j_repo.find_shortest_path.return_value = ["R1", "R2"]
-        mock_neo4j_repo.get_device.return_value = {
-            "id": "R1",
-            "capacity": 100.0,
-            "utilization": 0.3,
-            "status": "active"
-        }
+        mock_neo4j_repo.path = ["R1", "R2"]
+        mock_neo4j_repo.device = _DEVICE_R1
         
         # Mock Neo4j session
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        mock_result.single.return_value = {"s": {"id": "S005"}}
-        mock_session.run.return_value = mock_result
-        mock_neo4j_repo.driver.session.return_value.__enter__.return_value = mock_session
-        
-        mock_neo4j_repo.get_links_for_device.return_value = [
-            {
-                "id": "L1",
-                "source": "R1",
-                "target": "R2",
-                "utilization": 0.2,
-                "latency": 5.0
-            }
-        ]
+        mock_neo4j_repo.session.record = {"s": {"id": "S005"}}
         
-        # Execute
-        success, message = orchestrator.provision_service(service)
+        mock_neo4j_repo.links = _LINKS_R1_R2
+        
+        # Execute, tracing the SQL the metrics connection runs
+        with captured_sql(metrics_repo) as statements:
+            success, message = orchestrator.provision_service(service)
         
         # Assert
         assert success is True
         
+        # Device metrics, link metrics and the service log are committed together
+        assert statements.count("COMMIT") == 1
+        
         # Verify metrics were recorded
         device_metrics = metrics_repo.get_device_metrics("R1", limit=10)
         assert len(device_metrics) > 0
@@ -295,31 +217,13 @@ class TestServiceDecommissioning:
         # Setup
         service_id = "S006"
         
-        # Mock Neo4j session for service retrieval
-        mock_session = MagicMock()
-        
-        # First call returns service data
-        mock_get_result = MagicMock()
-        mock_get_result.single.return_value = {
-            "s": {
-                "id": service_id,
-                "path": ["R1", "R2", "R3"],
-                "status": "active"
-            }
-        }
-        
-        # Second call returns deletion confirmation
-        mock_delete_result = MagicMock()
-        mock_delete_result.single.return_value = {"deleted_count": 1}
-        
-        mock_session.run.side_effect = [mock_get_result, mock_delete_result]
-        mock_neo4j_repo.driver.session.return_value.__enter__.return_value = mock_session
+        # Mock Neo4j session: first call returns service data, second returns deletion confirmation
+        mock_neo4j_repo.session.queued = [
+            {"s": {"id": service_id, "path": ["R1", "R2", "R3"], "status": "active"}},
+            {"deleted_count": 1},
+        ]
         
-        mock_neo4j_repo.get_device.return_value = {
-            "id": "R1",
-            "utilization": 0.3,
-            "status": "active"
-        }
+        mock_neo4j_repo.device = _DEVICE_R1
         
         # Execute
         success, message = orchestrator.decommission_service(service_id)
@@ -334,11 +238,7 @@ class TestServiceDecommissioning:
         service_id = "S999"
         
         # Mock Neo4j session to return no service
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        mock_result.single.return_value = None
-        mock_session.run.return_value = mock_result
-        mock_neo4j_repo.driver.session.return_value.__enter__.return_value = mock_session
+        mock_neo4j_repo.session.record = None
         
         # Execute
         success, message = orchestrator.decommission_service(service_id)
@@ -352,29 +252,13 @@ class TestServiceDecommissioning:
         # Setup
         service_id = "S007"
         
-        # Mock Neo4j session
-        mock_session = MagicMock()
-        
-        mock_get_result = MagicMock()
-        mock_get_result.single.return_value = {
-            "s": {
-                "id": service_id,
-                "path": ["R1", "R2"],
-                "status": "active"
-            }
-        }
-        
-        mock_delete_result = MagicMock()
-        mock_delete_result.single.return_value = {"deleted_count": 1}
-        
-        mock_session.run.side_effect = [mock_get_result, mock_delete_result]
-        mock_neo4j_repo.driver.session.return_value.__enter__.return_value = mock_session
+        # Mock Neo4j session: first call returns service data, second returns deletion confirmation
+        mock_neo4j_repo.session.queued = [
+            {"s": {"id": service_id, "path": ["R1", "R2"], "status": "active"}},
+            {"deleted_count": 1},
+        ]
         
-        mock_neo4j_repo.get_device.return_value = {
-            "id": "R1",
-            "utilization": 0.5,
-            "status": "active"
-        }
+        mock_neo4j_repo.device = _DEVICE_R1
         
         # Execute
         success, message = orchestrator.decommission_service(service_id)
@@ -398,31 +282,16 @@ class TestRuleValidationIntegration:
         orchestrator = ServiceOrchestrator(mock_neo4j_repo, metrics_repo, rule_engine)
         
         # Setup service that should pass validation
-        service = Service(
-            id="S008",
-            service_type=ServiceType.MPLS_VPN,
-            source_device_id="R1",
-            target_device_id="R2",
-            bandwidth=30.0  # Within capacity
-        )
+        service = _svc(id="S008", bandwidth=30.0)  # Within capacity
         
         # Mock Neo4j responses
-        mock_neo4j_repo.find_shortest_path.return_value = ["R1", "R2"]
-        mock_neo4j_repo.get_device.return_value = {
-            "id": "R1",
-            "capacity": 100.0,
-            "utilization": 0.2,
-            "status": "active"
-        }
+        mock_neo4j_repo.path = ["R1", "R2"]
+        mock_neo4j_repo.device = _DEVICE_R1
         
         # Mock Neo4j session
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        mock_result.single.return_value = {"s": {"id": "S008"}}
-        mock_session.run.return_value = mock_result
-        mock_neo4j_repo.driver.session.return_value.__enter__.return_value = mock_session
+        mock_neo4j_repo.session.record = {"s": {"id": "S008"}}
         
-        mock_neo4j_repo.get_links_for_device.return_value = []
+        mock_neo4j_repo.links = []
         
         # Execute
         success, message = orchestrator.provision_service(service)